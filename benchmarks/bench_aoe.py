@@ -0,0 +1,75 @@
+"""Benchmark de daño en área: recorrido lineal frente a RadiusIndex.
+
+Para cientos de enemigos y varias explosiones por frame compara la prueba
+circular recorriendo todo el grupo en cada explosión con el índice en
+rejilla (una reconstrucción por frame + todas las explosiones en una pasada).
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_aoe.py
+"""
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame # pyright: ignore[reportMissingImports]
+from core.aoe import RadiusIndex
+
+WIDTH, HEIGHT = 1280, 720
+RADIUS = 50
+DAMAGE = 30
+FRAMES = 50
+
+
+def make_group(n, rng):
+    group = pygame.sprite.Group()
+    for _ in range(n):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(rng.randrange(WIDTH - 56), rng.randrange(HEIGHT - 56), 56, 56)
+        group.add(s)
+    return group
+
+
+def linear(group, blasts):
+    """Lo que haría Trap.explode recorriendo el grupo entero por cada explosión."""
+    total = {}
+    for x, y, radius, damage in blasts:
+        r2 = radius * radius
+        for s in group:
+            cx, cy = s.rect.center
+            if (cx - x) ** 2 + (cy - y) ** 2 < r2:
+                total[s] = total.get(s, 0) + damage
+    return total
+
+
+def time_per_frame(fn):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    rng = random.Random(1234)
+    index = RadiusIndex(cell_size=64)
+    print(f"{'enemigos':>9} {'explosiones':>12} {'lineal (ms)':>12} {'índice (ms)':>12} {'x':>6}")
+    for n in (200, 500, 1000):
+        group = make_group(n, rng)
+        for k in (1, 8, 32):
+            blasts = [(rng.randrange(WIDTH), rng.randrange(HEIGHT), RADIUS, DAMAGE) for _ in range(k)]
+
+            def indexed():
+                index.rebuild(group)
+                return index.damage_many(blasts)
+
+            assert linear(group, blasts) == indexed(), "RadiusIndex no coincide con el recorrido lineal"
+            t_lin = time_per_frame(lambda: linear(group, blasts))
+            t_idx = time_per_frame(indexed)
+            print(f"{n:>9} {k:>12} {t_lin:>12.3f} {t_idx:>12.3f} {t_lin / t_idx:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark de colisiones: pygame.sprite.groupcollide frente a SpatialHash.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_collision.py
+"""
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame # pyright: ignore[reportMissingImports]
+from core.spatial_hash import SpatialHash
+
+WIDTH, HEIGHT = 1280, 720
+NUM_ENEMIES = 40
+FRAMES = 30
+
+
+def make_group(n, size, rng):
+    group = pygame.sprite.Group()
+    for _ in range(n):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(rng.randrange(WIDTH - size[0]), rng.randrange(HEIGHT - size[1]), *size)
+        group.add(s)
+    return group
+
+
+def time_per_frame(fn):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    rng = random.Random(1234)
+    enemies = make_group(NUM_ENEMIES, (56, 56), rng)
+    grid = SpatialHash(cell_size=64)
+    print(f"{'balas':>8} {'pygame (ms)':>12} {'hash (ms)':>10} {'x':>6}")
+    for n in (100, 1000, 10000):
+        bullets = make_group(n, (8, 18), rng)
+
+        def brute():
+            return pygame.sprite.groupcollide(enemies, bullets, False, False)
+
+        def hashed():
+            grid.rebuild(bullets)
+            return grid.groupcollide(enemies, False, False)
+
+        assert brute() == hashed(), "SpatialHash no coincide con pygame.sprite.groupcollide"
+        t_brute = time_per_frame(brute)
+        t_hash = time_per_frame(hashed)
+        print(f"{n:>8} {t_brute:>12.3f} {t_hash:>10.3f} {t_brute / t_hash:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark del EntityStore frente a sprites: memoria por entidad y coste de update por frame.
+
+Crea N enemigos de entities/enemy.py como sprites (Enemy en un Group) y como
+entidades del EntityStore (spawn_enemy), mide la memoria que ocupan con
+tracemalloc y el tiempo de un frame de movimiento + culling
+(Group.update() frente a EntityStore.step()).
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_ecs.py
+"""
+import os
+import sys
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame # pyright: ignore[reportMissingImports]
+from core import settings
+from core.ecs import EntityStore
+from entities.enemy import Enemy, spawn_enemy
+
+FRAMES = 20
+
+
+def positions(n, rng):
+    # Lejos del borde inferior: nadie sale de pantalla durante la medición
+    return [(rng.randrange(settings.WIDTH), rng.randrange(settings.HEIGHT - 100)) for _ in range(n)]
+
+
+def build_sprites(points):
+    group = pygame.sprite.Group()
+    for x, y in points:
+        group.add(Enemy(x, y, enemy_type="ground"))
+    return group
+
+
+def build_store(points):
+    store = EntityStore(settings.WIDTH, settings.HEIGHT)
+    for x, y in points:
+        spawn_enemy(store, x, y, enemy_type="ground")
+    return store
+
+
+def measure(build, points):
+    """(objeto, bytes por entidad) según tracemalloc."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build(points)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return obj, used / len(points)
+
+
+def time_per_frame(fn):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    rng = random.Random(1234)
+    print(f"{'entidades':>10} {'sprite B':>9} {'store B':>8} {'x mem':>6} "
+          f"{'sprite ms':>10} {'store ms':>9} {'x tiempo':>9}")
+    for n in (1000, 10000, 50000):
+        points = positions(n, rng)
+        group, sprite_bytes = measure(build_sprites, points)
+        store, store_bytes = measure(build_store, points)
+        t_sprite = time_per_frame(group.update)
+        t_store = time_per_frame(store.step)
+        assert len(group) == len(store) == n
+        print(f"{n:>10} {sprite_bytes:>9.0f} {store_bytes:>8.0f} {sprite_bytes / store_bytes:>6.1f} "
+              f"{t_sprite:>10.3f} {t_store:>9.3f} {t_sprite / t_store:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Benchmark de frames: escenarios de estrés con el código real del juego.
+
+Cada escenario ejecuta frames completos (lógica + dibujo) bajo el driver de
+vídeo 'dummy' y mide el tiempo por frame (media y p95) y la memoria que se
+reserva en cada frame (pico de tracemalloc, en KiB, medido en una pasada
+aparte para no falsear los tiempos).
+
+Los resultados se comparan con benchmarks/baseline.json: si un escenario es
+más lento o reserva más que la referencia (más la tolerancia) el script lo
+indica y termina con código 1. La referencia depende de la máquina; tras un
+cambio intencionado o en otro equipo se regenera con --update-baseline.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_frames.py [--frames N] [--only nombre] [--update-baseline]
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # las rutas de assets son relativas a la raíz
+
+import pygame # pyright: ignore[reportMissingImports]
+import main as game
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+TIME_TOLERANCE = 0.25    # +25 % de tiempo por frame sobre la referencia
+ALLOC_TOLERANCE = 0.25   # +25 % de memoria reservada por frame
+ALLOC_SLACK_KIB = 4.0    # margen absoluto para escenarios que casi no reservan
+WARMUP_FRAMES = 30
+
+
+# ------------------------- ESCENARIOS -------------------------
+# Cada escenario devuelve una función frame() ya preparada para llamarse en bucle.
+
+def _main_display():
+    """La ventana de main.py (game_stack la cambia por la de core/game.py)."""
+    if pygame.display.get_surface().get_size() != (game.WIDTH, game.HEIGHT):
+        game.init_display(headless=True)
+
+
+def _session(level):
+    _main_display()
+    session = game.GameSession(seed=1234)
+    session.current_level = level
+    session.start_level()
+    session.player.hp = 10**9
+    session.player.is_entering = False
+    session.player.rect.y = session.player.target_y
+    return session
+
+
+def level10_max_waves():
+    """Nivel 10 con la oleada más grande en pantalla y el jugador disparando sin parar."""
+    session = _session(10)
+    session.total_waves = 10**9  # el nivel no termina nunca
+    session.wave_pause_ms = 0
+    session.spawn_wave(10, session.enemies_qty_base + 9)
+    controls = game.Controls(left=True, fire=True)
+
+    def frame():
+        # El jugador barre la pantalla de lado a lado disparando
+        rect = session.player.rect
+        if rect.left <= 0:
+            controls.left, controls.right = False, True
+        elif rect.right >= game.WIDTH:
+            controls.left, controls.right = True, False
+        session.step(controls)
+        session.draw(game.WIN)
+    return frame
+
+
+def boss_rafaga():
+    """Jefe del nivel 10 disparando su abanico con la ráfaga del jugador activa."""
+    session = _session(10)
+    session.enemies.empty()
+    session.scene.empty()
+    session.scene.add("player", session.player)
+    boss = game.Boss(session, 10)
+    boss.hp = 10**9
+    session.scene.add("boss", boss)
+    session.boss_spawned = True
+    controls = game.Controls(fire=True)
+
+    def frame():
+        player = session.player
+        player.rafaga_active = True
+        player.rafaga_timer = session.clock.now()
+        session.step(controls)
+        session.draw(game.WIN)
+    return frame
+
+
+def stars_10k():
+    """Fondo con 10.000 estrellas (backend por defecto)."""
+    _main_display()
+    starfield = game.SimpleStarfield(game.WIDTH, game.HEIGHT, num_stars=10000, num_planets=2, seed=1234)
+
+    def frame():
+        starfield.update(1.0)
+        starfield.draw(game.WIN)
+    return frame
+
+
+def game_stack():
+    """Pila core/game.py + entities/: 200 enemigos, disparo continuo, tesoros y trampas."""
+    from core import settings
+    from core.game import Game
+    from entities.enemy import Enemy
+    import random
+    random.seed(1234)
+    g = Game()
+    keys = pygame.key.ScancodeWrapper([False] * 512)
+    cols = settings.WIDTH // 40
+
+    def frame():
+        i = 0
+        while len(g.enemies) < 200:
+            e = Enemy((i % cols) * 40 + 20, -(i // cols) * 40, enemy_type="ground" if i % 2 else "flying")
+            g.all_sprites.add(e)
+            g.enemies.add(e)
+            i += 1
+        g.player.hp = 10**9
+        g.update(keys, shots=1)
+        g.draw()
+    return frame
+
+
+SCENARIOS = {
+    "level10_max_waves": level10_max_waves,
+    "boss_rafaga": boss_rafaga,
+    "stars_10k": stars_10k,
+    "game_stack": game_stack,
+}
+
+
+# ------------------------- MEDICIÓN -------------------------
+def measure(make_frame, frames):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        frame = make_frame()
+        for _ in range(WARMUP_FRAMES):
+            frame()
+        times = []
+        for _ in range(frames):
+            t0 = time.perf_counter()
+            frame()
+            times.append((time.perf_counter() - t0) * 1000)
+
+        # Segunda pasada con tracemalloc: pico de memoria reservada dentro de cada frame
+        frame = make_frame()
+        for _ in range(WARMUP_FRAMES):
+            frame()
+        tracemalloc.start()
+        peaks = []
+        for _ in range(frames):
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            frame()
+            peaks.append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+        tracemalloc.stop()
+
+    times.sort()
+    return {
+        "ms_mean": sum(times) / len(times),
+        "ms_p95": times[min(len(times) - 1, int(0.95 * len(times)))],
+        "alloc_kib": sum(peaks) / len(peaks),
+    }
+
+
+def regressions(name, result, base):
+    out = []
+    if result["ms_mean"] > base["ms_mean"] * (1 + TIME_TOLERANCE):
+        out.append(f"{name}: {result['ms_mean']:.3f} ms/frame (referencia {base['ms_mean']:.3f})")
+    if result["alloc_kib"] > base["alloc_kib"] * (1 + ALLOC_TOLERANCE) + ALLOC_SLACK_KIB:
+        out.append(f"{name}: {result['alloc_kib']:.1f} KiB/frame (referencia {base['alloc_kib']:.1f})")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--only", choices=sorted(SCENARIOS), action="append")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    game.init_display(headless=True)
+    game.load_assets()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = {}
+    failures = []
+    print(f"{'escenario':<20} {'ms/frame':>9} {'p95':>8} {'KiB/frame':>10} {'ref ms':>8}")
+    for name in args.only or SCENARIOS:
+        r = measure(SCENARIOS[name], args.frames)
+        results[name] = r
+        base = baseline.get(name)
+        ref = f"{base['ms_mean']:>8.3f}" if base else f"{'-':>8}"
+        print(f"{name:<20} {r['ms_mean']:>9.3f} {r['ms_p95']:>8.3f} {r['alloc_kib']:>10.1f} {ref}")
+        if base and not args.update_baseline:
+            failures += regressions(name, r, base)
+
+    if args.update_baseline:
+        baseline.update({k: {m: round(v, 4) for m, v in r.items()} for k, r in results.items()})
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Referencia actualizada: {BASELINE_PATH}")
+    elif failures:
+        print("\n*** REGRESIÓN DE RENDIMIENTO ***")
+        for line in failures:
+            print("  " + line)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Benchmark de colisión píxel a píxel: rects frente a máscaras cacheadas (y frente a collide_mask sin caché).
+
+Primera tabla: caso extremo con las imágenes reales del juego (enemigos,
+jefe y balas de main.py) y la rejilla SpatialHash, con miles de balas que no
+desaparecen al chocar. La sobrecarga del modo máscara solo aparece en los
+pares cuyos rects ya chocan, así que crece con el número de choques.
+
+Segunda tabla: partida real (nivel 10, oleada máxima, jugador disparando)
+grabada tick a tick; las consultas de colisión de cada tick se repiten sin
+eliminar nada en modo "rect" y "mask" sobre las mismas instantáneas.
+
+El objetivo es que el modo máscara cueste como mucho TARGET_OVERHEAD más
+que el de rects; cada tabla dice si se cumple. En el caso extremo no se
+cumple: cada choque de rects paga un Mask.overlap (en C, pero no gratis) y
+una llamada de Python, así que la sobrecarga crece con los choques.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_masks.py
+"""
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame # pyright: ignore[reportMissingImports]
+import main as game
+from core.masks import MaskCache, masks
+from core.spatial_hash import SpatialHash
+
+NUM_ENEMIES = 40
+FRAMES = 30
+GAME_TICKS = 1500
+REPEATS = 30
+TARGET_OVERHEAD = 0.05  # +5 % sobre rect como máximo
+
+
+def sprite(image, x, y):
+    s = pygame.sprite.Sprite()
+    s.image = image
+    s.rect = image.get_rect(topleft=(x, y))
+    return s
+
+
+def make_targets(rng):
+    group = pygame.sprite.Group()
+    for i in range(NUM_ENEMIES):
+        img = game.ENEMY_FLY_IMG if i % 3 == 0 else game.ENEMY_GROUND_IMG
+        group.add(sprite(img, rng.randrange(game.WIDTH - 56), rng.randrange(game.HEIGHT // 2)))
+    group.add(sprite(game.boss_image(), game.WIDTH // 2 - 130, 10))
+    return group
+
+
+def make_bullets(n, rng):
+    img = game.bullet_image((8, 18), (255, 0, 255))
+    return pygame.sprite.Group(sprite(img, rng.randrange(game.WIDTH - 8), rng.randrange(game.HEIGHT - 18))
+                               for _ in range(n))
+
+
+def time_per_frame(fn):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    game.init_display(headless=True)
+    game.load_assets()
+    rng = random.Random(1234)
+    targets = make_targets(rng)
+    grid = SpatialHash(cell_size=64)
+    cache = MaskCache()
+    worst = 0.0
+    print(f"{'balas':>8} {'rect (ms)':>10} {'máscara (ms)':>13} {'sobrecarga':>11} "
+          f"{'sin caché (ms)':>15} {'choques rect/máscara':>21}")
+    for n in (100, 1000, 10000):
+        bullets = make_bullets(n, rng)
+        grid.rebuild(bullets)
+
+        def rect_only():
+            return grid.groupcollide(targets, False, False)
+
+        def masked():
+            return grid.groupcollide(targets, False, False, cache.collide)
+
+        def uncached():
+            return grid.groupcollide(targets, False, False, pygame.sprite.collide_mask)
+
+        rect_hits = sum(map(len, rect_only().values()))
+        mask_hits = sum(map(len, masked().values()))
+        assert masked() == grid.groupcollide(targets, False, False, pygame.sprite.collide_mask), \
+            "MaskCache no coincide con pygame.sprite.collide_mask"
+        t_rect = time_per_frame(rect_only)
+        t_mask = time_per_frame(masked)
+        t_uncached = time_per_frame(uncached)
+        worst = max(worst, t_mask / t_rect - 1)
+        print(f"{n:>8} {t_rect:>10.3f} {t_mask:>13.3f} {(t_mask / t_rect - 1) * 100:>10.1f}% "
+              f"{t_uncached:>15.3f} {f'{rect_hits}/{mask_hits}':>21}")
+    print(verdict(worst, "peor caso"))
+    game_table()
+
+
+def verdict(overhead, label):
+    """Línea que dice si la sobrecarga del modo máscara cumple TARGET_OVERHEAD."""
+    ok = "cumplido" if overhead <= TARGET_OVERHEAD else "NO cumplido"
+    return f"Objetivo (sobrecarga <= {TARGET_OVERHEAD * 100:.0f} %): {ok}; {label} {overhead * 100:.1f} %"
+
+
+def snapshot(session):
+    """Copia (imágenes compartidas, rects copiados) de lo que colisiona en este tick."""
+    def copy(group):
+        return pygame.sprite.Group(sprite(s.image, *s.rect.topleft) for s in group)
+    bullets = copy(session.bullets)
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(bullets)
+    player = sprite(session.player.image, *session.player.rect.topleft)
+    return grid, copy(session.enemies), copy(session.boss_group), player, copy(session.enemy_bullets)
+
+
+def record_ticks():
+    """Nivel 10 en modo rect, jugador disparando: una instantánea por tick antes de las colisiones.
+
+    Las dos modalidades se miden luego sobre las mismas instantáneas; jugar
+    una partida por modo no sirve porque con máscaras la partida diverge.
+    """
+    game.COLLISION_MODE = "rect"
+    session = game.GameSession(seed=1234, headless=True)
+    session.current_level = 10
+    session.start_level()
+    session.player.hp = 10**9
+    session.total_waves = 10**9
+    session.wave_pause_ms = 0
+    controls = game.Controls(left=True, fire=True)
+    snaps = []
+    bullet_hits = session.bullet_hits
+
+    def recording(group):
+        # Justo antes de las colisiones del tick, con las balas ya movidas y aún sin eliminar
+        if group is session.enemies:
+            snaps.append(snapshot(session))
+        return bullet_hits(group)
+    session.bullet_hits = recording
+    for _ in range(GAME_TICKS):
+        rect = session.player.rect
+        if rect.left <= 0:
+            controls.left, controls.right = False, True
+        elif rect.right >= game.WIDTH:
+            controls.left, controls.right = True, False
+        session.step(controls)
+    return snaps
+
+
+def collide_all(snaps, collided):
+    """Las consultas de colisión de GameSession.step, sin eliminar nada; devuelve el nº de choques."""
+    hits = 0
+    for grid, enemies, boss, player, enemy_bullets in snaps:
+        hits += sum(map(len, grid.groupcollide(enemies, False, False, collided).values()))
+        hits += sum(map(len, grid.groupcollide(boss, False, False, collided).values()))
+        hits += len(pygame.sprite.spritecollide(player, enemy_bullets, False, collided))
+    return hits
+
+
+def game_table():
+    snaps = record_ticks()
+    bullets = sum(len(s[0].group) for s in snaps) / len(snaps)
+    print(f"\nNivel 10, {len(snaps)} ticks grabados (media de {bullets:.0f} balas del jugador por tick); "
+          f"mismas instantáneas en los dos modos")
+    print(f"{'modo':>8} {'colisión (µs/tick)':>19} {'choques':>8} {'sobrecarga':>11}")
+    assert collide_all(snaps, masks.collide) == collide_all(snaps, pygame.sprite.collide_mask)
+    modes = (("rect", None), ("mask", masks.collide))
+    hits = {mode: collide_all(snaps, collided) for mode, collided in modes}  # también calienta la caché
+    # Pasadas alternadas y el mínimo de cada modo: las cifras son de microsegundos y el ruido pesa
+    best = {mode: float("inf") for mode, _ in modes}
+    for _ in range(REPEATS):
+        for mode, collided in modes:
+            best[mode] = min(best[mode], _timed(collide_all, snaps, collided) / len(snaps) * 1e6)
+    for mode, _ in modes:
+        extra = "" if mode == "rect" else f"{(best[mode] / best['rect'] - 1) * 100:>10.1f}%"
+        print(f"{mode:>8} {best[mode]:>19.2f} {hits[mode]:>8} {extra:>11}")
+    print(verdict(best["mask"] / best["rect"] - 1, "medida"))
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
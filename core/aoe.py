@@ -0,0 +1,65 @@
+class RadiusIndex:
+    """Índice de centros de sprites en rejilla para daño en área (explosiones, salpicaduras).
+
+    Se reconstruye una vez por frame con `rebuild(group)`; después cada
+    consulta circular solo mira las celdas que toca el círculo y prueba la
+    distancia real al centro de cada sprite (no una franja ni un rect).
+    `damage_many` resuelve varias explosiones del mismo frame de una vez.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.sprites = []
+        self.group = None
+
+    def rebuild(self, group):
+        """Indexa el centro de cada sprite de `group`."""
+        cs = self.cell_size
+        cells = {}
+        sprites = group.sprites()
+        for i, sprite in enumerate(sprites):
+            cx, cy = sprite.rect.center
+            key = (cx // cs, cy // cs)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(i, cx, cy)]
+            else:
+                bucket.append((i, cx, cy))
+        self.cells = cells
+        self.sprites = sprites
+        self.group = group
+
+    def _indices(self, x, y, radius):
+        cs = self.cell_size
+        cells = self.cells
+        r2 = radius * radius
+        hits = []
+        for gx in range(int(x - radius) // cs, int(x + radius) // cs + 1):
+            for gy in range(int(y - radius) // cs, int(y + radius) // cs + 1):
+                bucket = cells.get((gx, gy))
+                if bucket is not None:
+                    for i, cx, cy in bucket:
+                        dx = cx - x
+                        dy = cy - y
+                        if dx * dx + dy * dy < r2:
+                            hits.append(i)
+        return hits
+
+    def query(self, x, y, radius):
+        """Sprites cuyo centro está a menos de `radius` de (x, y), en el orden del grupo."""
+        hits = self._indices(x, y, radius)
+        hits.sort()
+        group = self.group
+        sprites = self.sprites
+        # Los sprites eliminados después de rebuild() ya no cuentan.
+        return [sprites[i] for i in hits if sprites[i] in group]
+
+    def damage_many(self, blasts):
+        """Daño total por sprite de varias explosiones: `blasts` es [(x, y, radio, daño), ...]."""
+        total = {}
+        for x, y, radius, damage in blasts:
+            for i in self._indices(x, y, radius):
+                total[i] = total.get(i, 0) + damage
+        group = self.group
+        sprites = self.sprites
+        return {sprites[i]: dmg for i, dmg in sorted(total.items()) if sprites[i] in group}
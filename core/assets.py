@@ -0,0 +1,75 @@
+import pygame # pyright: ignore[reportMissingImports]
+
+class AssetCache:
+    """Caché central de imágenes por (ruta, tamaño).
+
+    Cada imagen se lee del disco, se decodifica y se convierte una sola vez;
+    todos los sprites que la piden comparten la misma Surface (no se debe
+    modificar). Las variantes escaladas se generan a partir de la original
+    ya cacheada. `preload` permite cargar por adelantado lo que usará una
+    escena y `evict_scene` liberarlo al salir de ella.
+
+    Si hay un paquete horneado (`use_pack`) se consulta antes de decodificar
+    el PNG: sus imágenes ya vienen escaladas y no pasan por smoothscale.
+    """
+    def __init__(self):
+        self.images = {}
+        self.scenes = {}
+        self.pack = None
+        self.loads = 0  # lecturas reales de disco (útil para comprobar que la caché funciona)
+        self.baked_hits = 0
+
+    @staticmethod
+    def _key(path, size):
+        return (path, tuple(size) if size else None)
+
+    def use_pack(self, pack):
+        """Usa `pack` (core.bake.BakedPack o None) como fuente previa a los PNG."""
+        if self.pack is not None and self.pack is not pack:
+            self.pack.close()
+        self.pack = pack
+
+    def image(self, path, size=None):
+        """Devuelve la imagen de `path` (escalada a `size` si se indica) cargándola si hace falta."""
+        key = self._key(path, size)
+        img = self.images.get(key)
+        if img is None and self.pack is not None:
+            img = self.pack.get(path, size)
+            if img is not None:
+                self.baked_hits += 1
+                self.images[key] = img
+        if img is None:
+            if size:
+                img = pygame.transform.smoothscale(self.image(path), size)
+            else:
+                img = pygame.image.load(path).convert_alpha()
+                self.loads += 1
+            self.images[key] = img
+        return img
+
+    def preload(self, entries, scene=None):
+        """Carga `entries` (rutas o tuplas (ruta, tamaño)) y las asocia a `scene`."""
+        keys = self.scenes.setdefault(scene, set()) if scene is not None else None
+        for entry in entries:
+            path, size = (entry, None) if isinstance(entry, str) else entry
+            self.image(path, size)
+            if keys is not None:
+                keys.add(self._key(path, size))
+                keys.add(self._key(path, None))  # la original de la que se escaló
+
+    def evict(self, path, size=None):
+        """Olvida una imagen concreta; la próxima petición la vuelve a cargar."""
+        self.images.pop(self._key(path, size), None)
+
+    def evict_scene(self, scene):
+        """Olvida todas las imágenes precargadas para `scene`."""
+        for key in self.scenes.pop(scene, ()):
+            self.images.pop(key, None)
+
+    def clear(self):
+        self.images.clear()
+        self.scenes.clear()
+
+
+# Caché compartida por todo el juego
+assets = AssetCache()
@@ -0,0 +1,172 @@
+"""Paquete de sprites "horneados": imágenes ya escaladas y en RGBA crudo.
+
+Decodificar PNGs de 1-2 MB y reducirlos con smoothscale domina el tiempo de
+arranque. `bake()` hace ese trabajo una vez y guarda los píxeles finales de
+todas las imágenes en un único archivo; `BakedPack` lo abre con mmap y crea
+cada Surface directamente desde esos bytes (solo queda un convert_alpha).
+
+Cada entrada guarda mtime, tamaño y SHA-1 del PNG de origen; si el PNG cambia
+la entrada se considera obsoleta y `ensure_baked()` rehace el paquete.
+
+Uso (desde la raíz del proyecto):
+    python -m core.bake
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import pygame # pyright: ignore[reportMissingImports]
+
+MAGIC = b"SABK"
+VERSION = 1
+_HEADER = struct.Struct("<4sII")  # magic, versión, longitud del índice JSON
+_ALIGN = 16
+
+
+def _sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_info(path):
+    st = os.stat(path)
+    return {"mtime": st.st_mtime_ns, "bytes": st.st_size}
+
+
+def _render(path, size):
+    """Mismo resultado que la carga normal: convert_alpha y luego smoothscale."""
+    img = pygame.image.load(path).convert_alpha()
+    if size:
+        img = pygame.transform.smoothscale(img, size)
+    return img
+
+
+def bake(entries, out_path):
+    """Hornea `entries` ([(ruta, tamaño o None), ...]) en `out_path`. Necesita una ventana creada."""
+    index = []
+    blobs = []
+    offset = 0
+    for path, size in entries:
+        if not os.path.exists(path):
+            continue
+        img = _render(path, size)
+        data = pygame.image.tobytes(img, "RGBA")
+        pad = (-len(data)) % _ALIGN
+        index.append(dict(path=path, size=list(size) if size else None, w=img.get_width(),
+                          h=img.get_height(), offset=offset, length=len(data),
+                          sha1=_sha1(path), **_source_info(path)))
+        blobs.append(data + b"\0" * pad)
+        offset += len(data) + pad
+
+    header = json.dumps({"entries": index}).encode("utf-8")
+    header += b" " * ((-(_HEADER.size + len(header))) % _ALIGN)
+    folder = os.path.dirname(out_path) or "."
+    os.makedirs(folder, exist_ok=True)
+    # Temporal único + os.replace: varios procesos pueden hornear a la vez (p. ej. los workers de
+    # tools/balance_sweep.py) y quien abre `out_path` ve siempre un paquete completo, nunca uno a medias.
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(out_path) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, out_path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        # En Windows no se puede reemplazar un paquete que otro proceso tiene abierto: vale el suyo
+        if not os.path.exists(out_path):
+            raise
+
+
+class BakedPack:
+    """Paquete horneado abierto con mmap; `get()` devuelve None si la entrada falta o está obsoleta."""
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, header_len = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"paquete horneado no válido: {path}")
+            header = json.loads(bytes(self._mm[_HEADER.size:_HEADER.size + header_len]))
+        except Exception:
+            self.close()
+            raise
+        self._data_start = _HEADER.size + header_len
+        end = max((e["offset"] + e["length"] for e in header["entries"]), default=0)
+        if self._data_start + end > len(self._mm):
+            self.close()
+            raise ValueError(f"paquete horneado incompleto: {path}")
+        self.entries = {(e["path"], tuple(e["size"]) if e["size"] else None): e for e in header["entries"]}
+
+    def is_fresh(self, entry):
+        """La entrada corresponde al PNG actual (mtime/tamaño, o SHA-1 si el mtime cambió)."""
+        path = entry["path"]
+        if not os.path.exists(path):
+            return False
+        info = _source_info(path)
+        if info["mtime"] == entry["mtime"] and info["bytes"] == entry["bytes"]:
+            return True
+        return info["bytes"] == entry["bytes"] and _sha1(path) == entry["sha1"]
+
+    def stale(self, entries):
+        """Entradas pedidas que faltan en el paquete o cuyo PNG cambió."""
+        out = []
+        for path, size in entries:
+            entry = self.entries.get((path, tuple(size) if size else None))
+            if entry is None:
+                if os.path.exists(path):
+                    out.append((path, size))
+            elif not self.is_fresh(entry):
+                out.append((path, size))
+        return out
+
+    def get(self, path, size=None):
+        entry = self.entries.get((path, tuple(size) if size else None))
+        if entry is None or not self.is_fresh(entry):
+            return None
+        start = self._data_start + entry["offset"]
+        view = memoryview(self._mm)[start:start + entry["length"]]
+        # frombuffer no copia; convert_alpha crea la Surface definitiva en el formato de la pantalla.
+        img = pygame.image.frombuffer(view, (entry["w"], entry["h"]), "RGBA").convert_alpha()
+        view.release()
+        return img
+
+    def close(self):
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+def ensure_baked(entries, out_path):
+    """Abre el paquete de `out_path`, rehaciéndolo antes si falta o tiene entradas obsoletas."""
+    if os.path.exists(out_path):
+        try:
+            pack = BakedPack(out_path)
+        except (ValueError, OSError, struct.error, json.JSONDecodeError):
+            pack = None
+        if pack is not None:
+            if not pack.stale(entries):
+                return pack
+            pack.close()
+    bake(entries, out_path)
+    return BakedPack(out_path)
+
+
+if __name__ == "__main__":
+    import sys
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    sys.path.insert(0, os.getcwd())
+    import main
+    main.init_display(headless=True)
+    bake(main.BAKED_ENTRIES, main.BAKED_ASSETS_PATH)
+    print(f"Paquete horneado: {main.BAKED_ASSETS_PATH}")
@@ -0,0 +1,160 @@
+import weakref
+
+import pygame # pyright: ignore[reportMissingImports]
+
+class CanvasBase:
+    """Parte común de los lienzos que ocupan el lugar de la Surface de la ventana.
+
+    Exponen el tamaño del mundo (`self.size`) con la interfaz de Surface y
+    blits() se reparte en llamadas a blit(); cada subclase implementa blit,
+    fill y present.
+    """
+    # ---------------- interfaz tipo Surface ----------------
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        blit = self.blit
+        rects = [blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+
+class ScaledCanvas(CanvasBase):
+    """Lienzo a resolución interna con la interfaz de Surface que usa el juego, presentado escalado.
+
+    Se dibuja en coordenadas del mundo (las de la simulación, `world_size`):
+    blit/blits/fill escalan posiciones e imágenes a la resolución interna
+    (`render_size`) y get_size()/get_rect() devuelven el tamaño del mundo, así
+    que el código de dibujo no cambia. Cada imagen se escala una sola vez
+    (caché por identidad de la Surface con referencias débiles, como las
+    texturas de TextureCanvas): la versión escalada se libera cuando su
+    Surface deja de existir. Quien repinta una Surface en su sitio debe
+    llamar a `forget` para que se escale de nuevo.
+
+    `present()` lleva el lienzo a la ventana, del tamaño que sea, centrado y
+    con bandas negras: "integer" usa el mayor múltiplo entero que cabe
+    (píxeles nítidos) y "smooth" ajusta al máximo tamaño con la misma
+    proporción. Sin acceso a píxeles en coordenadas del mundo: quien escribe
+    píxeles directamente debe comprobar que el destino es una pygame.Surface.
+    """
+    def __init__(self, world_size, render_size, scaling="smooth"):
+        self.size = tuple(world_size)
+        self.render_size = tuple(render_size)
+        self.surface = pygame.Surface(self.render_size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.sx = self.render_size[0] / self.size[0]
+        self.sy = self.render_size[1] / self.size[1]
+        self.identity = self.render_size == self.size
+        self.scaling = scaling
+        self.images = weakref.WeakKeyDictionary()  # Surface -> Surface escalada
+        self._layout = None
+
+    # ---------------- interfaz tipo Surface ----------------
+    def _scale_rect(self, rect):
+        sx, sy = self.sx, self.sy
+        left, top = round(rect.left * sx), round(rect.top * sy)
+        return pygame.Rect(left, top, round(rect.right * sx) - left, round(rect.bottom * sy) - top)
+
+    def image(self, surface):
+        """`surface` a la escala interna; se escala la primera vez que se dibuja."""
+        if self.identity:
+            return surface
+        scaled = self.images.get(surface)
+        if scaled is not None:
+            return scaled
+        w, h = surface.get_size()
+        size = (max(1, round(w * self.sx)), max(1, round(h * self.sy)))
+        colorkey = surface.get_colorkey()
+        if colorkey is None and surface.get_bitsize() in (24, 32):
+            scaled = pygame.transform.smoothscale(surface, size)
+        else:
+            scaled = pygame.transform.scale(surface, size)  # sin mezclar el color clave con los bordes
+            if colorkey is not None:
+                scaled.set_colorkey(colorkey)
+        alpha = surface.get_alpha()
+        if alpha is not None and alpha != 255:
+            scaled.set_alpha(alpha)
+        self.images[surface] = scaled
+        return scaled
+
+    def forget(self, surface):
+        """Descarta la versión escalada de `surface` (p. ej. si se repintó en su sitio)."""
+        self.images.pop(surface, None)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        x, y = dest[0], dest[1]
+        if area is not None:
+            area = pygame.Rect(area).clip(source.get_rect())
+            w, h = area.size
+            if not self.identity:
+                area = self._scale_rect(area)
+        else:
+            w, h = source.get_size()
+        self.surface.blit(self.image(source), (round(x * self.sx), round(y * self.sy)), area, special_flags)
+        return pygame.Rect(int(x), int(y), w, h).clip(self.get_rect())
+
+    def fill(self, color, rect=None, special_flags=0):
+        if rect is None:
+            self.surface.fill(color, None, special_flags)
+            return self.get_rect()
+        rect = pygame.Rect(rect)
+        self.surface.fill(color, self._scale_rect(rect), special_flags)
+        return rect.clip(self.get_rect())
+
+    # ---------------- presentación ----------------
+    def _fit(self, window):
+        """Subsuperficie de la ventana donde se presenta el lienzo (centrada)."""
+        rw, rh = self.render_size
+        ww, wh = window.get_size()
+        k = min(ww // rw, wh // rh)
+        if self.scaling == "integer" and k >= 1:
+            size = (rw * k, rh * k)
+        else:
+            f = min(ww / rw, wh / rh)
+            size = (max(1, int(rw * f)), max(1, int(rh * f)))
+        rect = pygame.Rect((0, 0), size)
+        rect.center = (ww // 2, wh // 2)
+        window.fill((0, 0, 0))  # bandas negras
+        return window.subsurface(rect)
+
+    def present(self):
+        window = pygame.display.get_surface()
+        # La ventana puede cambiar de tamaño (RESIZABLE): se recalcula la zona de destino
+        if self._layout is None or self._layout[0] is not window or self._layout[1] != window.get_size():
+            self._layout = (window, window.get_size(), self._fit(window))
+        dest = self._layout[2]
+        size = dest.get_size()
+        if size == self.render_size:
+            dest.blit(self.surface, (0, 0))
+        elif (self.scaling == "integer" and size[0] % self.render_size[0] == 0) or \
+                self.surface.get_bitsize() not in (24, 32):
+            pygame.transform.scale(self.surface, size, dest)
+        else:
+            pygame.transform.smoothscale(self.surface, size, dest)
+        pygame.display.flip()
+
+
+def create_scaled_canvas(world_size, render_size=None, window_size=None, fullscreen=False, scaling="smooth"):
+    """Abre la ventana (o pantalla completa) y devuelve un ScaledCanvas para dibujar en ella.
+
+    `render_size` (resolución interna) y `window_size` son por defecto el
+    tamaño del mundo; la simulación sigue usando `world_size`.
+    """
+    if fullscreen:
+        pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    else:
+        pygame.display.set_mode(window_size or world_size, pygame.RESIZABLE)
+    return ScaledCanvas(world_size, render_size or world_size, scaling)
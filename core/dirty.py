@@ -0,0 +1,70 @@
+import pygame # pyright: ignore[reportMissingImports]
+
+class DirtyRects:
+    """Seguimiento manual de rects sucios para pygame.display.update(rects).
+
+    Con `enabled=False` se comporta como el dibujo de siempre: present()
+    hace display.flip(). Con `enabled=True` el fondo es una superficie fija:
+    begin() borra solo lo que se dibujó el frame anterior y present() envía
+    a pantalla únicamente esas zonas más las nuevas.
+
+    `flip` es la función que presenta el frame completo (por defecto
+    pygame.display.flip; con el backend GPU, TextureCanvas.present).
+    """
+    def __init__(self, enabled=False, flip=None):
+        self.enabled = enabled
+        self.flip = flip or pygame.display.flip
+        self.background = None
+        self.prev = []
+        self.cur = []
+        self.full = True
+
+    def set_background(self, background):
+        """Cambia el fondo fijo; el siguiente frame se repinta entero."""
+        self.background = background
+        self.full = True
+
+    def begin(self, surface):
+        if not self.enabled:
+            return
+        if self.full:
+            surface.blit(self.background, (0, 0))
+        else:
+            for r in self.prev:
+                surface.blit(self.background, r, r)
+
+    def add(self, *rects):
+        self.cur.extend(r for r in rects if r)
+
+    def add_list(self, rects):
+        if rects:
+            self.cur.extend(rects)
+
+    def present(self):
+        if not self.enabled or self.full:
+            self.flip()
+            self.full = False
+        else:
+            pygame.display.update(self.prev + self.cur)
+        self.prev = self.cur
+        self.cur = []
+
+
+class CachedText:
+    """Texto del HUD que solo se vuelve a renderizar cuando cambia su contenido."""
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.text = None
+        self.surface = None
+
+    def render(self, text):
+        if text != self.text:
+            self.surface = self.font.render(text, self.antialias, self.color)
+            self.text = text
+        return self.surface
+
+    def draw(self, surface, text, pos):
+        """Dibuja `text` en `pos` y devuelve el rect ocupado."""
+        return surface.blit(self.render(text), pos)
@@ -0,0 +1,118 @@
+import numpy as np
+
+from core.soa import ArrayStore
+
+class EntityStore(ArrayStore):
+    """Almacén de entidades por componentes: cada componente es un array (NumPy).
+
+    Posición, velocidad, tamaño, vida, daño, valor, etiqueta (tipo de
+    entidad) y tipo visual viven en arrays contiguos; las entidades vivas
+    ocupan siempre el prefijo [0, count) en orden de creación. Los sistemas
+    (movimiento + culling, colisiones, dibujo) son una sola pasada vectorizada
+    sobre los arrays, sin un objeto ni una llamada a update() por entidad.
+
+    Los índices de una entidad cambian cuando se eliminan otras: se usan
+    dentro de un mismo frame (select -> colisiones -> remove), no se guardan.
+    """
+    FIELDS = (("x", "f4"), ("y", "f4"), ("vx", "f4"), ("vy", "f4"), ("w", "i4"), ("h", "i4"),
+              ("hp", "i4"), ("damage", "i4"), ("value", "i4"), ("tag", "u1"), ("kind", "u2"))
+
+    def __init__(self, width, height, capacity=256):
+        super().__init__(width, height, capacity)
+        self.tags = {}
+
+    def tag_id(self, name):
+        """Id numérico de la etiqueta `name` ("enemy", "projectile", ...)."""
+        t = self.tags.get(name)
+        if t is None:
+            t = self.tags[name] = len(self.tags)
+        return t
+
+    def make_image(self, image):
+        """El tipo visual es la propia Surface compartida."""
+        return image
+
+    def spawn(self, tag, image, center, vx=0, vy=0, hp=0, damage=0, value=0):
+        """Crea una entidad con `image` centrada en `center` y devuelve su índice."""
+        self._reserve(1)
+        i = self.count
+        w, h = image.get_size()
+        # Igual que image.get_rect(center=center)
+        self.x[i] = center[0] - w // 2
+        self.y[i] = center[1] - h // 2
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.w[i] = w
+        self.h[i] = h
+        self.hp[i] = hp
+        self.damage[i] = damage
+        self.value[i] = value
+        self.tag[i] = self.tag_id(tag)
+        self.kind[i] = self.kind_id(image)
+        self.count += 1
+        return i
+
+    def select(self, tag):
+        """Índices (en orden) de las entidades con etiqueta `tag`."""
+        return np.flatnonzero(self.tag[:self.count] == self.tag_id(tag))
+
+    def remove(self, indices):
+        if len(indices):
+            keep = np.ones(self.count, dtype=bool)
+            keep[indices] = False
+            self._keep(keep)
+
+    # ---------------- sistemas ----------------
+    def step(self):
+        """Movimiento + culling: integra la velocidad y elimina lo que sale de pantalla.
+
+        Como en los sprites: lo que baja desaparece al pasar el borde inferior
+        y lo que sube al pasar el superior.
+        """
+        n = self.count
+        if not n:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        vy = self.vy[:n]
+        x += self.vx[:n]
+        y += vy
+        gone = ((y > self.height) & (vy >= 0)) | ((y + self.h[:n] < 0) & (vy < 0))
+        if gone.any():
+            self._keep(~gone)
+
+    def overlapping(self, rect, tag):
+        """Índices de `tag` cuyo rect choca con `rect` (como spritecollide)."""
+        idx = self.select(tag)
+        x = self.x[idx]
+        y = self.y[idx]
+        hit = ((x < rect.right) & (x + self.w[idx] > rect.left) &
+               (y < rect.bottom) & (y + self.h[idx] > rect.top))
+        return idx[hit]
+
+    def first_hits(self, targets, shots, chunk=4096):
+        """Choques de `shots` contra `targets` (arrays de índices), como groupcollide(targets, shots).
+
+        Cada disparo cuenta solo para el primer objetivo que toca. Devuelve
+        (objetivos tocados en orden, disparos que tocaron algo).
+        """
+        if not len(targets) or not len(shots):
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        tx = self.x[targets][:, None]
+        ty = self.y[targets][:, None]
+        tr = tx + self.w[targets][:, None]
+        tb = ty + self.h[targets][:, None]
+        firsts = []
+        used = []
+        for start in range(0, len(shots), chunk):
+            s = shots[start:start + chunk]
+            sx = self.x[s][None, :]
+            sy = self.y[s][None, :]
+            overlap = ((sx < tr) & (sx + self.w[s][None, :] > tx) &
+                       (sy < tb) & (sy + self.h[s][None, :] > ty))
+            hit = overlap.any(axis=0)
+            firsts.append(overlap.argmax(axis=0)[hit])
+            used.append(s[hit])
+        hit_targets = targets[np.unique(np.concatenate(firsts))]
+        return hit_targets, np.concatenate(used)
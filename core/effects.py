@@ -0,0 +1,44 @@
+import pygame # pyright: ignore[reportMissingImports]
+
+class EffectCache:
+    """Sprites de efectos (estelas, escudos, marcas) pre-renderizados una vez y reutilizados.
+
+    Los efectos que se dibujan cada frame con pygame.draw sobre una Surface
+    nueva pasan a ser un simple blit de una Surface cacheada. Las Surfaces
+    devueltas son compartidas: no se deben modificar.
+    """
+    def __init__(self):
+        self.sprites = {}
+
+    def get(self, key, build):
+        """Surface cacheada bajo `key`; `build()` la crea la primera vez."""
+        surf = self.sprites.get(key)
+        if surf is None:
+            surf = self.sprites[key] = build()
+        return surf
+
+    def ellipse(self, size, color):
+        """Elipse rellena de `color` (RGBA) que ocupa toda una Surface de tamaño `size`."""
+        key = ("ellipse", tuple(size), tuple(color))
+        surf = self.sprites.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.ellipse(surf, color, surf.get_rect())
+            self.sprites[key] = surf
+        return surf
+
+    def fade(self, size, color, steps, max_alpha=255):
+        """Lista de `steps` elipses de `color` con alfa creciente de 0 a `max_alpha` (p. ej. una estela)."""
+        key = ("fade", tuple(size), tuple(color), steps, max_alpha)
+        seq = self.sprites.get(key)
+        if seq is None:
+            seq = self.sprites[key] = [self.ellipse(size, (*color, int(max_alpha * (i / max(1, steps - 1)))))
+                                       for i in range(steps)]
+        return seq
+
+    def clear(self):
+        self.sprites.clear()
+
+
+# Caché compartida por todo el juego
+effects = EffectCache()
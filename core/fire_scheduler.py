@@ -0,0 +1,51 @@
+import heapq
+import math
+import random
+
+class FireScheduler:
+    """Programa el próximo disparo de cada enemigo en lugar de tirar un dado por enemigo y frame.
+
+    Disparar con probabilidad `chance` en cada frame equivale a esperar un
+    número de frames con distribución geométrica; se sortea esa espera una
+    vez por disparo (con un RNG propio, reproducible con `seed`) y se guarda
+    en un heap. Cada frame solo se miran los enemigos a los que les toca, así
+    que el coste no crece con el tamaño de la oleada.
+    """
+    def __init__(self, chance=0.0, seed=None):
+        self.rng = random.Random(seed)
+        self.chance = chance
+        self.frame = 0
+        self.heap = []
+        self._seq = 0  # desempate estable dentro del heap
+
+    def set_chance(self, chance):
+        self.chance = chance
+
+    def clear(self):
+        self.heap.clear()
+
+    def _delay(self):
+        """Frames hasta el próximo disparo (geométrica con probabilidad `chance`)."""
+        p = self.chance
+        if p >= 1.0:
+            return 1
+        if p <= 0.0:
+            return math.inf
+        u = 1.0 - self.rng.random()  # (0, 1]
+        return int(math.log(u) / math.log(1.0 - p)) + 1
+
+    def add(self, enemy):
+        self._seq += 1
+        heapq.heappush(self.heap, (self.frame + self._delay(), self._seq, enemy))
+
+    def due(self, group):
+        """Avanza un frame y devuelve los enemigos de `group` que disparan en él."""
+        self.frame += 1
+        heap = self.heap
+        shooters = []
+        while heap and heap[0][0] <= self.frame:
+            _, _, enemy = heapq.heappop(heap)
+            if enemy in group:  # los eliminados simplemente se descartan
+                shooters.append(enemy)
+                self.add(enemy)
+        return shooters
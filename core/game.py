@@ -1,17 +1,35 @@
 import pygame, random # pyright: ignore[reportMissingImports]
 from core import settings
+from core.assets import assets
+from core.masks import collide_mask
+from core.canvas import create_scaled_canvas
 from entities.player import Player
-from entities.enemy import Enemy
-from entities.treasure import Treasure
-from entities.trap import Trap
+from entities.enemy import Enemy, spawn_enemy
+from entities.projectile import spawn_projectile
+from entities.treasure import Treasure, spawn_treasure
+from entities.trap import Trap, spawn_trap
 
 class Game:
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+        # Con resolución interna o ventana de otro tamaño se dibuja en un ScaledCanvas
+        if settings.INTERNAL_RESOLUTION or settings.WINDOW_SIZE or settings.FULLSCREEN:
+            self.screen = create_scaled_canvas((settings.WIDTH, settings.HEIGHT), settings.INTERNAL_RESOLUTION,
+                                               settings.WINDOW_SIZE, settings.FULLSCREEN, settings.SCALE_MODE)
+            self.present = self.screen.present
+        else:
+            self.screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+            self.present = pygame.display.flip
         pygame.display.set_caption("🚀 Space Shooter RPG")
         self.clock = pygame.time.Clock()
 
+        # Precarga: los drops de tesoro/trampa al matar enemigos ya no leen PNGs del disco en mitad de un frame
+        assets.preload([("assets/player.png", settings.PLAYER_SIZE),
+                        ("assets/enemy_ground.png", settings.ENEMY_SIZE),
+                        ("assets/enemy_flying.png", settings.ENEMY_SIZE),
+                        ("assets/treasure.png", settings.TREASURE_SIZE),
+                        ("assets/trap.png", settings.TRAP_SIZE)], scene="game")
+
         # Grupos de sprites
         self.all_sprites = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
@@ -19,12 +37,29 @@ class Game:
         self.treasures = pygame.sprite.Group()
         self.traps = pygame.sprite.Group()
 
+        # Colisiones por rect o píxel a píxel (settings.COLLISION_MODE)
+        self.collided = collide_mask if settings.COLLISION_MODE == "mask" else None
+
+        # Con ENTITY_BACKEND = "ecs" enemigos, proyectiles, tesoros y trampas viven en un
+        # EntityStore (arrays NumPy) en lugar de ser sprites; el jugador sigue siendo un sprite.
+        self.store = None
+        if settings.ENTITY_BACKEND == "ecs":
+            try:
+                from core.ecs import EntityStore
+            except ImportError:
+                print("[ADVERTENCIA] NumPy no está instalado; se usan sprites.")
+            else:
+                self.store = EntityStore(settings.WIDTH, settings.HEIGHT)
+
         # Crear jugador
         self.player = Player(settings.WIDTH//2, settings.HEIGHT-50)
         self.all_sprites.add(self.player)
 
         # Spawn inicial de enemigos
         for i in range(5):
+            if self.store is not None:
+                spawn_enemy(self.store, i*100+100, 50, enemy_type="ground")
+                continue
             enemy = Enemy(i*100+100, 50, enemy_type="ground")
             self.all_sprites.add(enemy)
             self.enemies.add(enemy)
@@ -35,58 +70,120 @@ class Game:
             self.clock.tick(settings.FPS)
 
             # Eventos
+            shots = 0
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
-                        self.player.shoot(self.projectiles)
-                        self.all_sprites.add(self.projectiles)
-
-            # Movimiento jugador
-            keys = pygame.key.get_pressed()
-            self.player.update(keys)
-
-            # Actualizar enemigos, proyectiles, tesoros, trampas
-            self.enemies.update()
-            self.projectiles.update()
-            self.treasures.update()
-            self.traps.update()
-
-            # Colisiones proyectil-enemigo
-            hits = pygame.sprite.groupcollide(self.enemies, self.projectiles, True, True)
-            for enemy in hits:
-                # Drop de tesoro o trampa aleatorio
-                if random.random() < 0.5:
-                    treasure = Treasure(enemy.rect.x, enemy.rect.y, value=50)
-                    self.all_sprites.add(treasure)
-                    self.treasures.add(treasure)
-                else:
-                    trap = Trap(enemy.rect.x, enemy.rect.y)
-                    self.all_sprites.add(trap)
-                    self.traps.add(trap)
-
-                # Recompensa de experiencia y dinero
-                self.player.add_exp(50)
-                self.player.add_money(20)
-
-            # Colisiones jugador-tesoro
-            treasures_collected = pygame.sprite.spritecollide(self.player, self.treasures, True)
-            for treasure in treasures_collected:
-                self.player.add_money(treasure.value)
-
-            # Colisiones jugador-trampa
-            traps_hit = pygame.sprite.spritecollide(self.player, self.traps, True)
-            for trap in traps_hit:
-                self.player.hp -= trap.damage
-                print(f"💥 Has recibido {trap.damage} de daño. HP restante: {self.player.hp}")
-                if self.player.hp <= 0:
-                    print("☠️ GAME OVER")
-                    running = False
+                        shots += 1  # un disparo por pulsación, aunque lleguen varias en el mismo frame
 
-            # Dibujar
-            self.screen.fill(settings.BLACK)
-            self.all_sprites.draw(self.screen)
-            pygame.display.flip()
+            if not self.update(pygame.key.get_pressed(), shots):
+                running = False
+            self.draw()
+            self.present()
 
+        assets.evict_scene("game")
         pygame.quit()
+
+    def update(self, keys, shots=0):
+        """Avanza un frame de la lógica con `shots` disparos; devuelve False si el jugador ha muerto."""
+        if self.store is not None:
+            return self._update_store(keys, shots)
+        for _ in range(shots):
+            self.player.shoot(self.projectiles)
+            self.all_sprites.add(self.projectiles)
+
+        # Movimiento jugador
+        self.player.update(keys)
+
+        # Actualizar enemigos, proyectiles, tesoros, trampas
+        self.enemies.update()
+        self.projectiles.update()
+        self.treasures.update()
+        self.traps.update()
+
+        # Colisiones proyectil-enemigo
+        hits = pygame.sprite.groupcollide(self.enemies, self.projectiles, True, True, self.collided)
+        for enemy in hits:
+            # Drop de tesoro o trampa aleatorio
+            if random.random() < 0.5:
+                treasure = Treasure(enemy.rect.x, enemy.rect.y, value=50)
+                self.all_sprites.add(treasure)
+                self.treasures.add(treasure)
+            else:
+                trap = Trap(enemy.rect.x, enemy.rect.y)
+                self.all_sprites.add(trap)
+                self.traps.add(trap)
+
+            # Recompensa de experiencia y dinero
+            self.player.add_exp(50)
+            self.player.add_money(20)
+
+        # Colisiones jugador-tesoro
+        treasures_collected = pygame.sprite.spritecollide(self.player, self.treasures, True, self.collided)
+        for treasure in treasures_collected:
+            self.player.add_money(treasure.value)
+
+        # Colisiones jugador-trampa
+        traps_hit = pygame.sprite.spritecollide(self.player, self.traps, True, self.collided)
+        for trap in traps_hit:
+            self.player.hp -= trap.damage
+            print(f"💥 Has recibido {trap.damage} de daño. HP restante: {self.player.hp}")
+            if self.player.hp <= 0:
+                print("☠️ GAME OVER")
+                return False
+        return True
+
+    def _update_store(self, keys, shots):
+        """Lo mismo que update() con las entidades en el EntityStore (colisiones por rect)."""
+        store = self.store
+        player = self.player
+        for _ in range(shots):
+            spawn_projectile(store, player.rect.centerx, player.rect.top)
+
+        player.update(keys)
+        # Movimiento + culling de todas las entidades en una pasada
+        store.step()
+
+        # Colisiones proyectil-enemigo
+        killed, used = store.first_hits(store.select("enemy"), store.select("projectile"))
+        drops = list(zip(store.x[killed].astype(int).tolist(), store.y[killed].astype(int).tolist()))
+        store.remove(killed.tolist() + used.tolist())
+        for x, y in drops:
+            # Drop de tesoro o trampa aleatorio
+            if random.random() < 0.5:
+                spawn_treasure(store, x, y, value=50)
+            else:
+                spawn_trap(store, x, y)
+
+            # Recompensa de experiencia y dinero
+            player.add_exp(50)
+            player.add_money(20)
+
+        # Colisiones jugador-tesoro
+        collected = store.overlapping(player.rect, "treasure")
+        values = store.value[collected].tolist()
+        store.remove(collected)
+        for value in values:
+            player.add_money(value)
+
+        # Colisiones jugador-trampa
+        traps_hit = store.overlapping(player.rect, "trap")
+        damages = store.damage[traps_hit].tolist()
+        store.remove(traps_hit)
+        for damage in damages:
+            player.hp -= damage
+            print(f"💥 Has recibido {damage} de daño. HP restante: {player.hp}")
+            if player.hp <= 0:
+                print("☠️ GAME OVER")
+                return False
+        return True
+
+    def draw(self):
+        self.screen.fill(settings.BLACK)
+        if self.store is not None:
+            self.screen.blit(self.player.image, self.player.rect)
+            self.store.draw(self.screen)
+            return
+        self.all_sprites.draw(self.screen)
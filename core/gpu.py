@@ -0,0 +1,138 @@
+import weakref
+
+import pygame # pyright: ignore[reportMissingImports]
+
+from core.canvas import CanvasBase
+
+# pygame._sdl2 es opcional (API experimental de pygame 2): sin él no hay backend GPU
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture, error as SDLError
+except ImportError:
+    Window = Renderer = Texture = None
+    SDLError = pygame.error
+
+# Modos de mezcla de SDL (SDL_BlendMode)
+BLENDMODE_NONE = 0
+BLENDMODE_BLEND = 1
+BLENDMODE_ADD = 2
+BLENDMODE_MOD = 4
+
+# SDL_BlendFactor / SDL_BlendOperation para componer la resta (dst - src)
+_FACTOR_ONE = 2
+_OP_REV_SUBTRACT = 3
+
+
+class TextureCanvas(CanvasBase):
+    """Lienzo con la parte de la interfaz de Surface que usa el juego, dibujado con un Renderer de SDL2.
+
+    blit/blits/fill/get_size/get_rect se comportan como en una Surface, pero
+    cada imagen se sube una sola vez como Texture y la mezcla con alfa y el
+    escalado a la ventana los hace el renderer. La caché va por identidad de
+    la Surface con referencias débiles: la textura se libera cuando su
+    Surface deja de existir (p. ej. un texto del HUD que cambió). Quien
+    repinta una Surface en su sitio debe llamar a `forget` para que se suba
+    de nuevo.
+
+    special_flags: BLEND_ADD y BLEND_MULT se traducen a los modos de SDL; las
+    restas usan un modo compuesto si el renderer lo soporta. Lo que el
+    renderer no puede expresar no se dibuja.
+    Sin acceso a píxeles: quien escribe píxeles directamente debe comprobar
+    que el destino es una pygame.Surface.
+    """
+    def __init__(self, renderer, size, window=None):
+        self.renderer = renderer
+        self.window = window
+        self.size = tuple(size)
+        self.textures = weakref.WeakKeyDictionary()  # Surface -> Texture
+        self.uploads = 0
+        self._sub_mode = None
+        renderer.logical_size = self.size  # la ventana puede tener otro tamaño: escala el renderer
+
+    # ---------------- interfaz tipo Surface ----------------
+    def texture(self, surface):
+        """Texture de `surface`; la sube la primera vez que se dibuja."""
+        tex = self.textures.get(surface)
+        if tex is None:
+            tex = self.textures[surface] = Texture.from_surface(self.renderer, surface)
+            self.uploads += 1
+        return tex
+
+    def forget(self, surface):
+        """Descarta la textura de `surface` (p. ej. si se repintó en su sitio)."""
+        self.textures.pop(surface, None)
+
+    def _blend_mode(self, special_flags):
+        """Modo de SDL para `special_flags`; None si el renderer no puede expresarlo."""
+        if special_flags in (pygame.BLEND_ADD, pygame.BLEND_RGBA_ADD):
+            return BLENDMODE_ADD
+        if special_flags in (pygame.BLEND_MULT, pygame.BLEND_RGBA_MULT):
+            return BLENDMODE_MOD
+        if special_flags in (pygame.BLEND_SUB, pygame.BLEND_RGBA_SUB):
+            if self._sub_mode is None:
+                self._sub_mode = self.renderer.compose_custom_blend_mode(
+                    (_FACTOR_ONE, _FACTOR_ONE, _OP_REV_SUBTRACT), (_FACTOR_ONE, _FACTOR_ONE, _OP_REV_SUBTRACT))
+            return self._sub_mode or None
+        return None
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        x, y = dest[0], dest[1]
+        if area is not None:
+            area = pygame.Rect(area).clip(source.get_rect())
+            w, h = area.size
+        else:
+            w, h = source.get_size()
+        rect = pygame.Rect(int(x), int(y), w, h)
+        tex = self.texture(source)
+        if special_flags:
+            mode = self._blend_mode(special_flags)
+            if mode is None:
+                return rect.clip(self.get_rect())
+            previous = tex.blend_mode
+            try:
+                tex.blend_mode = mode
+                tex.draw(srcrect=area, dstrect=rect)
+            except (pygame.error, SDLError):
+                self._sub_mode = 0  # el renderer no soporta el modo compuesto: no se vuelve a intentar
+            finally:
+                tex.blend_mode = previous
+        else:
+            tex.draw(srcrect=area, dstrect=rect)
+        return rect.clip(self.get_rect())
+
+    def fill(self, color, rect=None, special_flags=0):
+        renderer = self.renderer
+        renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            renderer.clear()
+            return self.get_rect()
+        rect = pygame.Rect(rect)
+        renderer.fill_rect(rect)
+        return rect.clip(self.get_rect())
+
+    def present(self):
+        self.renderer.present()
+
+
+def create_canvas(size, title, accelerated=-1, vsync=False, window_size=None, fullscreen=False):
+    """Ventana + Renderer de SDL2 envueltos en un TextureCanvas, o None si no se puede.
+
+    Se dibuja a `size` y el renderer lo escala a la ventana (`window_size`,
+    por defecto `size`, o pantalla completa). `accelerated`: 1 solo GPU, 0 el
+    renderer por software de SDL (sirve para probar sin GPU), -1 el mejor
+    disponible. Crea además un modo de vídeo
+    oculto de 1x1 para que convert()/convert_alpha() sigan funcionando.
+    """
+    if Renderer is None:
+        print("[ADVERTENCIA] pygame._sdl2 no está disponible; se usa el dibujo por software.")
+        return None
+    window = None
+    try:
+        window = Window(title, size=window_size or size, resizable=True, fullscreen_desktop=fullscreen)
+        renderer = Renderer(window, accelerated=accelerated, vsync=vsync)
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    except (pygame.error, SDLError) as e:
+        if window is not None:
+            window.destroy()
+        print(f"[ADVERTENCIA] No se pudo crear el renderer de SDL2 ({e}); se usa el dibujo por software.")
+        return None
+    return TextureCanvas(renderer, size, window)
@@ -0,0 +1,74 @@
+import weakref
+
+import pygame # pyright: ignore[reportMissingImports]
+
+_MISSING = object()
+
+
+class MaskCache:
+    """Máscaras de colisión creadas una sola vez por imagen.
+
+    Los sprites comparten sus Surfaces (caché de assets, pool de balas), así
+    que la máscara se calcula por Surface y no por sprite ni por llamada.
+    Una imagen sin píxeles transparentes se marca como "llena" y choca igual
+    que su rect, sin llegar a usar la máscara. La caché usa referencias
+    débiles: la máscara se libera cuando su Surface deja de existir.
+    """
+    def __init__(self):
+        self.masks = weakref.WeakKeyDictionary()  # Surface -> Mask (None si es opaca)
+        self.full_masks = {}  # máscaras llenas por tamaño
+        self.built = 0  # máscaras calculadas (útil para comprobar que la caché funciona)
+
+    def get(self, image):
+        """Máscara de `image`, o None si la imagen es totalmente opaca."""
+        mask = self.masks.get(image, _MISSING)
+        if mask is not _MISSING:
+            return mask
+        mask = pygame.mask.from_surface(image)
+        self.built += 1
+        if mask.count() == image.get_width() * image.get_height():
+            mask = None
+        self.masks[image] = mask
+        return mask
+
+    def collide(self, a, b):
+        """Prueba fina entre dos sprites: primero rects, después solapamiento de máscaras.
+
+        Se usa como `collided` en spritecollide/groupcollide (de pygame o de SpatialHash).
+        """
+        ra = a.rect
+        rb = b.rect
+        if not ra.colliderect(rb):
+            return False
+        cached = self.masks
+        ma = cached.get(a.image, _MISSING)
+        if ma is _MISSING:
+            ma = self.get(a.image)
+        mb = cached.get(b.image, _MISSING)
+        if mb is _MISSING:
+            mb = self.get(b.image)
+        if ma is None and mb is None:
+            return True
+        offset = (rb.x - ra.x, rb.y - ra.y)
+        if ma is None:
+            ma = self._full(a.image)
+        if mb is None:
+            mb = self._full(b.image)
+        return ma.overlap(mb, offset) is not None
+
+    def _full(self, image):
+        """Máscara llena del tamaño de `image` (para cruzar un sprite opaco con uno con huecos)."""
+        size = image.get_size()
+        mask = self.full_masks.get(size)
+        if mask is None:
+            mask = self.full_masks[size] = pygame.mask.Mask(size, fill=True)
+        return mask
+
+    def clear(self):
+        self.masks.clear()
+        self.full_masks.clear()
+
+
+# Caché compartida por todo el juego
+masks = MaskCache()
+collide_mask = masks.collide
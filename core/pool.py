@@ -0,0 +1,53 @@
+import pygame # pyright: ignore[reportMissingImports]
+
+class SpritePool:
+    """Lista libre de sprites pre-asignados que se reutilizan en lugar de crearse."""
+    def __init__(self, factory, prealloc=0):
+        self.factory = factory
+        self.free = [factory() for _ in range(prealloc)]
+        self.created = prealloc
+
+    def acquire(self):
+        if self.free:
+            return self.free.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, sprite):
+        self.free.append(sprite)
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite que vuelve a su pool al salir de todos sus grupos.
+
+    Las subclases definen `activate(...)` para reiniciar su estado y se les
+    asigna un pool con `Subclase.pool = SpritePool(Subclase, n)`. Se crean
+    con `Subclase.spawn(...)` en lugar del constructor.
+    """
+    pool = None
+
+    def __init__(self):
+        super().__init__()
+        self.active = False
+
+    @classmethod
+    def spawn(cls, *args, **kwargs):
+        sprite = cls.pool.acquire()
+        sprite.activate(*args, **kwargs)
+        sprite.active = True
+        return sprite
+
+    def kill(self):
+        super().kill()
+        self._release()
+
+    def remove_internal(self, group):
+        # Cubre Group.remove/Group.empty, que no pasan por kill().
+        super().remove_internal(group)
+        if not self.alive():
+            self._release()
+
+    def _release(self):
+        if self.active:
+            self.active = False
+            self.pool.release(self)
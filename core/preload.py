@@ -0,0 +1,101 @@
+import queue
+import threading
+import traceback
+
+import pygame # pyright: ignore[reportMissingImports]
+
+class AssetPreloader:
+    """Carga imágenes de la caché en un hilo de fondo.
+
+    El hilo solo decodifica el PNG y lo escala (no toca la pantalla); el
+    hilo principal llama a `poll()` cuando le viene bien (p. ej. en la pausa
+    entre oleadas) y ahí hace la parte barata: convert_alpha y guardar el
+    resultado en la caché. `get()` devuelve la imagen ya lista o, si aún no
+    ha llegado, espera a que termine (o la carga directamente).
+    """
+    def __init__(self, cache):
+        self.cache = cache
+        self._requests = queue.Queue()
+        self._ready = []
+        self._lock = threading.Lock()
+        self._pending = {}  # clave -> Event que se activa cuando el hilo termina
+        self._thread = None
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="asset-preloader", daemon=True)
+            self._thread.start()
+
+    def _worker(self):
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            key, done = item
+            path, size = key
+            img, scaled = None, False
+            try:
+                img = pygame.image.load(path)
+                if size and img.get_bitsize() >= 24:  # smoothscale solo acepta 24/32 bits
+                    img = pygame.transform.smoothscale(img, size)
+                    scaled = True
+            except (pygame.error, OSError) as e:
+                print(f"[ADVERTENCIA] No se pudo precargar {path}: {e}")
+                img = None
+            except Exception:
+                # Un fallo inesperado no debe matar el hilo: las peticiones siguientes quedarían sin atender
+                traceback.print_exc()
+                img = None
+            finally:
+                # Siempre se avisa: get() espera a `done` y, sin imagen, la carga él mismo
+                with self._lock:
+                    self._ready.append((key, img, scaled))
+                done.set()
+
+    def request(self, entries):
+        """Encola `entries` (rutas o tuplas (ruta, tamaño)) que no estén ya en la caché."""
+        for entry in entries:
+            path, size = (entry, None) if isinstance(entry, str) else entry
+            key = self.cache._key(path, size)
+            if key in self.cache.images or key in self._pending:
+                continue
+            pack = self.cache.pack
+            if pack is not None and key in pack.entries:
+                continue  # el paquete horneado ya la sirve al instante
+            done = threading.Event()
+            self._pending[key] = done
+            self._start()
+            self._requests.put((key, done))
+
+    def poll(self):
+        """Entrega a la caché lo que el hilo ya ha cargado (solo desde el hilo principal)."""
+        with self._lock:
+            ready, self._ready = self._ready, []
+        for key, img, scaled in ready:
+            self._pending.pop(key, None)
+            if img is None:
+                continue
+            img = img.convert_alpha()
+            if key[1] and not scaled:
+                img = pygame.transform.smoothscale(img, key[1])
+            self.cache.images[key] = img
+            self.cache.loads += 1
+        return len(ready)
+
+    def get(self, path, size=None):
+        """Imagen de `path`; si está en camino espera al hilo en vez de cargarla dos veces."""
+        key = self.cache._key(path, size)
+        done = self._pending.get(key)
+        if done is not None:
+            done.wait()
+            self.poll()
+        return self.cache.image(path, size)
+
+    def busy(self):
+        return bool(self._pending)
+
+    def close(self):
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join()
+            self._thread = None
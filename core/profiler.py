@@ -0,0 +1,201 @@
+import csv
+import json
+import time
+from collections import deque
+
+import pygame # pyright: ignore[reportMissingImports]
+
+class _Scope:
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof, name):
+        self.prof = prof
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.prof.add(self.name, time.perf_counter() - self.t0)
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class FrameProfiler:
+    """Tiempos por fase de cada frame, conteos por grupo y percentiles del tiempo de frame.
+
+    Uso: `begin_frame()`, `with profiler.scope("fase"): ...` alrededor de cada
+    parte del bucle y `end_frame(counts)` al final. Las fases se suman si se
+    repiten en el mismo frame (p. ej. varios ticks de simulación). Desactivado,
+    `scope()` devuelve un contexto vacío y no mide nada.
+
+    Se guarda una fila por frame para exportar la sesión (`export`), pero solo
+    las últimas `max_rows` (unos 0,5 KB por fila: 20000 filas son ~10 MB, unos
+    5 minutos a 60 FPS o menos sin límite de FPS); el resumen y las medias por
+    fase cubren la sesión entera. Para p50/p95/p99 y el overlay se usa una
+    ventana de los últimos `history` frames.
+    """
+    def __init__(self, history=600, enabled=False, max_rows=20000):
+        self.enabled = enabled
+        self.frame_times = deque(maxlen=history)  # ms
+        self.phase_names = []
+        self.count_names = []
+        self.rows = deque(maxlen=max_rows)
+        self.frames = 0        # frames medidos en la sesión (también los que ya no están en rows)
+        self.phase_totals = {}  # ms acumulados por fase en la sesión
+        self.current = {}
+        self.last = {}
+        self.counts = {}
+        self._scopes = {}
+        self._t0 = None
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        s = self._scopes.get(name)
+        if s is None:
+            s = self._scopes[name] = _Scope(self, name)
+        return s
+
+    def add(self, name, seconds):
+        if name not in self.current:
+            self.current[name] = 0.0
+            if name not in self.phase_names:
+                self.phase_names.append(name)
+        self.current[name] += seconds * 1000.0
+
+    def begin_frame(self):
+        if self.enabled:
+            self._t0 = time.perf_counter()
+            self.current = {}
+
+    def end_frame(self, counts=None):
+        """Cierra el frame; `counts` es {grupo: nº de entidades} (p. ej. Scene.counts())."""
+        if not self.enabled or self._t0 is None:
+            return
+        total = (time.perf_counter() - self._t0) * 1000.0
+        self._t0 = None
+        self.frame_times.append(total)
+        self.last = self.current
+        self.counts = counts or {}
+        for name in self.counts:
+            if name not in self.count_names:
+                self.count_names.append(name)
+        self.rows.append((total, self.current, self.counts))
+        self.frames += 1
+        totals = self.phase_totals
+        for name, ms in self.current.items():
+            totals[name] = totals.get(name, 0.0) + ms
+
+    def percentiles(self, ps=(50, 95, 99)):
+        """Percentiles del tiempo de frame (ms) sobre la ventana reciente."""
+        data = sorted(self.frame_times)
+        if not data:
+            return {p: 0.0 for p in ps}
+        n = len(data)
+        return {p: data[min(n - 1, int(p / 100 * n))] for p in ps}
+
+    def summary(self):
+        """Resumen de la sesión: frames, percentiles y media por fase (de toda la sesión)."""
+        n = self.frames
+        phases = {name: self.phase_totals.get(name, 0.0) / n if n else 0.0 for name in self.phase_names}
+        return {"frames": n, "exported_frames": len(self.rows),
+                "percentiles_ms": {f"p{p}": v for p, v in self.percentiles().items()},
+                "phase_mean_ms": phases}
+
+    def export(self, path):
+        """Guarda la sesión: CSV (una fila por frame) o JSON (resumen + frames) según la extensión.
+
+        Solo se exportan los últimos `max_rows` frames; `frame` sigue numerando desde el inicio.
+        """
+        if path.endswith(".csv"):
+            first = self.frames - len(self.rows)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(["frame", "frame_ms"] + self.phase_names + self.count_names)
+                for i, (total, phases, counts) in enumerate(self.rows, first):
+                    w.writerow([i, round(total, 3)]
+                               + [round(phases.get(n, 0.0), 3) for n in self.phase_names]
+                               + [counts.get(n, 0) for n in self.count_names])
+        else:
+            frames = [{"frame_ms": t, "phases": p, "counts": c} for t, p, c in self.rows]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.summary(), "frames": frames}, f)
+
+    def reset(self):
+        self.frame_times.clear()
+        self.phase_names.clear()
+        self.count_names.clear()
+        self.rows.clear()
+        self.frames = 0
+        self.phase_totals = {}
+        self.current = {}
+        self.last = {}
+        self.counts = {}
+
+
+class PerfOverlay:
+    """Panel en pantalla con los datos del profiler (texto + gráfica de los últimos frames)."""
+    def __init__(self, profiler, font, refresh_frames=15, budget_ms=1000 / 60):
+        self.profiler = profiler
+        self.font = font
+        self.refresh_frames = refresh_frames
+        self.budget_ms = budget_ms
+        self.visible = False
+        self.panel = None
+        self._frames = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.panel = None
+
+    def _lines(self):
+        prof = self.profiler
+        pc = prof.percentiles()
+        lines = [f"frame p50 {pc[50]:.2f}  p95 {pc[95]:.2f}  p99 {pc[99]:.2f} ms"]
+        lines += [f"{name:<16}{prof.last.get(name, 0.0):6.2f} ms" for name in prof.phase_names]
+        lines.append("  ".join(f"{k}:{v}" for k, v in prof.counts.items()))
+        return lines
+
+    def _render(self):
+        lines = [self.font.render(t, True, (230, 240, 255)) for t in self._lines()]
+        graph_h = 40
+        w = max([180] + [s.get_width() for s in lines]) + 12
+        h = sum(s.get_height() for s in lines) + graph_h + 16
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 6
+        for s in lines:
+            panel.blit(s, (6, y))
+            y += s.get_height()
+        # Gráfica: una barra por frame; la línea marca el presupuesto de un tick
+        base = h - 6
+        times = list(self.profiler.frame_times)[-(w - 12):]
+        scale = graph_h / (self.budget_ms * 2)
+        for i, t in enumerate(times):
+            color = (90, 220, 120) if t <= self.budget_ms else (240, 90, 70)
+            bar = min(graph_h, int(t * scale))
+            pygame.draw.line(panel, color, (6 + i, base), (6 + i, base - bar))
+        pygame.draw.line(panel, (255, 255, 255), (6, base - graph_h // 2), (w - 6, base - graph_h // 2))
+        return panel
+
+    def draw(self, surface, pos):
+        """Dibuja el panel (si está visible) y devuelve su rect."""
+        if not self.visible:
+            return None
+        self._frames += 1
+        if self.panel is None or self._frames >= self.refresh_frames:
+            self.panel = self._render()
+            self._frames = 0
+        return surface.blit(self.panel, pos)
@@ -0,0 +1,94 @@
+import numpy as np
+import pygame # pyright: ignore[reportMissingImports]
+
+from core.soa import ArrayStore
+
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+class ProjectileEngine(ArrayStore):
+    """Proyectiles como estructura de arrays (NumPy).
+
+    Posición, velocidad, tamaño, daño, dueño y tipo visual viven en arrays
+    contiguos; los vivos ocupan siempre el prefijo [0, count). Mover, culling
+    de los que salen de pantalla y colisiones contra una lista de rects son
+    operaciones vectorizadas. No se crean sprites: el dibujo es un solo
+    Surface.blits con una imagen compartida por tipo.
+    """
+    FIELDS = (("x", "f4"), ("y", "f4"), ("vx", "f4"), ("vy", "f4"),
+              ("w", "i4"), ("h", "i4"), ("damage", "i4"), ("owner", "u1"), ("kind", "u2"))
+
+    def __init__(self, width, height, capacity=1024):
+        super().__init__(width, height, capacity)
+
+    def make_image(self, key):
+        """Imagen del tipo visual `key` = (tamaño, color, alpha)."""
+        size, color, alpha = key
+        img = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+        img.fill(color)
+        return img
+
+    def spawn(self, x, y, vx, vy, size, color, damage=1, owner=OWNER_PLAYER, alpha=True):
+        """Crea un proyectil centrado en (x, y)."""
+        self.spawn_many([x], [y], [vx], [vy], size, color, damage, owner, alpha)
+
+    def spawn_many(self, xs, ys, vxs, vys, size, color, damage=1, owner=OWNER_PLAYER, alpha=True):
+        """Crea varios proyectiles del mismo tipo de una vez (p.ej. el abanico del jefe)."""
+        n = len(xs)
+        self._reserve(n)
+        w, h = size
+        s = slice(self.count, self.count + n)
+        # Igual que rect(center=(x, y)) con coordenadas enteras.
+        self.x[s] = np.asarray(xs, dtype=np.int32) - w // 2
+        self.y[s] = np.asarray(ys, dtype=np.int32) - h // 2
+        self.vx[s] = vxs
+        self.vy[s] = vys
+        self.w[s] = w
+        self.h[s] = h
+        self.damage[s] = damage
+        self.owner[s] = owner
+        self.kind[s] = self.kind_id((size, color, alpha))
+        self.count += n
+
+    def step(self):
+        """Integra un paso y elimina los que salen de pantalla."""
+        n = self.count
+        if not n:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        keep = ((x + self.w[:n] >= 0) & (x <= self.width) &
+                (y + self.h[:n] >= 0) & (y <= self.height))
+        self._keep(keep)
+
+    def collide(self, rects, owner, dokill=True):
+        """Choca los proyectiles de `owner` contra `rects`.
+
+        Devuelve un array con el daño total recibido por cada rect. Como en
+        pygame.sprite.groupcollide, cada proyectil cuenta solo para el primer
+        rect de la lista que toca.
+        """
+        damage = np.zeros(len(rects), dtype=np.int64)
+        n = self.count
+        if not n or not rects:
+            return damage
+        mine = np.flatnonzero(self.owner[:n] == owner)
+        if not mine.size:
+            return damage
+        r = np.array([(rc.left, rc.top, rc.right, rc.bottom) for rc in rects], dtype=np.float32)
+        x = self.x[mine]
+        y = self.y[mine]
+        overlap = ((x[None, :] < r[:, 2:3]) & (x[None, :] + self.w[mine][None, :] > r[:, 0:1]) &
+                   (y[None, :] < r[:, 3:4]) & (y[None, :] + self.h[mine][None, :] > r[:, 1:2]))
+        hit = overlap.any(axis=0)
+        if not hit.any():
+            return damage
+        first = overlap.argmax(axis=0)[hit]
+        np.add.at(damage, first, self.damage[mine][hit])
+        if dokill:
+            keep = np.ones(n, dtype=bool)
+            keep[mine[hit]] = False
+            self._keep(keep)
+        return damage
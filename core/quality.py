@@ -0,0 +1,111 @@
+import csv
+import os
+from collections import deque
+
+class QualityTier:
+    """Un nivel de calidad visual. Solo toca lo cosmético: nunca la simulación."""
+    __slots__ = ("name", "stars", "trail", "blend", "planets")
+
+    def __init__(self, name, stars=1.0, trail=14, blend=True, planets=True):
+        self.name = name
+        self.stars = stars      # fracción de estrellas que se dibujan (0..1)
+        self.trail = trail      # puntos de la estela del jugador que se dibujan
+        self.blend = blend      # fondo con imagen mezclada + degradado
+        self.planets = planets  # planetas del fondo
+
+    def __repr__(self):
+        return f"QualityTier({self.name!r})"
+
+
+# De mejor a peor calidad
+DEFAULT_TIERS = [
+    QualityTier("alta", stars=1.0, trail=14, blend=True, planets=True),
+    QualityTier("media", stars=0.6, trail=8, blend=True, planets=True),
+    QualityTier("baja", stars=0.3, trail=4, blend=False, planets=True),
+    QualityTier("minima", stars=0.0, trail=0, blend=False, planets=False),
+]
+
+
+class QualityGovernor:
+    """Ajusta el nivel de calidad según el tiempo de frame de una ventana móvil.
+
+    `observe(frame_ms)` recibe el tiempo de trabajo de cada frame (sin la
+    espera del limitador de FPS). Con la ventana llena se mira su percentil
+    `quantile`: por encima de `budget_ms * down_ratio` se baja un nivel y por
+    debajo de `budget_ms * up_ratio` se sube uno. La banda entre ambos umbrales
+    y los `cooldown` frames mínimos entre cambios (más la ventana vacía tras
+    cada cambio) evitan que el nivel oscile.
+
+    Cada cambio se guarda en `events` (frame, desde, hacia, ms medidos) y,
+    si se pasa `log_path`, se añade como fila a ese CSV.
+    """
+    def __init__(self, budget_ms, tiers=None, window=90, quantile=0.9,
+                 down_ratio=1.0, up_ratio=0.7, cooldown=180, log_path=None, enabled=True):
+        self.tiers = list(tiers or DEFAULT_TIERS)
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=window)
+        self.quantile = quantile
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.cooldown = cooldown
+        self.log_path = log_path
+        self.enabled = enabled
+        self.index = 0
+        self.frame = 0
+        self.last_change = -cooldown
+        self.events = []
+
+    @property
+    def tier(self):
+        return self.tiers[self.index]
+
+    def _measured(self):
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.quantile))]
+
+    def observe(self, frame_ms):
+        """Registra un frame; devuelve el nuevo QualityTier si cambió el nivel, o None."""
+        self.frame += 1
+        if not self.enabled:
+            return None
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.samples.maxlen or self.frame - self.last_change < self.cooldown:
+            return None
+        ms = self._measured()
+        if ms > self.budget_ms * self.down_ratio and self.index < len(self.tiers) - 1:
+            return self._change(self.index + 1, ms)
+        if ms < self.budget_ms * self.up_ratio and self.index > 0:
+            return self._change(self.index - 1, ms)
+        return None
+
+    def set_tier(self, index):
+        """Fija el nivel a mano (p. ej. al arrancar); no cuenta como cambio automático."""
+        self.index = max(0, min(len(self.tiers) - 1, index))
+        self.samples.clear()
+        self.last_change = self.frame
+        return self.tier
+
+    def _change(self, index, ms):
+        old = self.tier
+        self.index = index
+        self.samples.clear()
+        self.last_change = self.frame
+        event = {"frame": self.frame, "from": old.name, "to": self.tier.name, "ms": round(ms, 3),
+                 "budget_ms": round(self.budget_ms, 3)}
+        self.events.append(event)
+        print(f"[CALIDAD] frame {self.frame}: {old.name} -> {self.tier.name} "
+              f"(p{int(self.quantile * 100)} {ms:.1f} ms, presupuesto {self.budget_ms:.1f} ms)")
+        if self.log_path:
+            self._append_log(event)
+        return self.tier
+
+    def _append_log(self, event):
+        new = not os.path.exists(self.log_path)
+        folder = os.path.dirname(self.log_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.log_path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(event))
+            if new:
+                writer.writeheader()
+            writer.writerow(event)
@@ -0,0 +1,94 @@
+import struct
+
+MAGIC = b"SARP"
+VERSION = 1
+_HEADER = struct.Struct("<4sBQHI")  # magic, versión, semilla, ticks por segundo, nº de ticks
+
+
+def _write_varint(out, n):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, pos):
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """Graba la entrada de cada tick (un entero de bits) como rachas (bits, repeticiones).
+
+    La entrada casi nunca cambia de un tick al siguiente, así que solo se
+    guardan los cambios: cada racha ocupa 1 byte de bits + 1-3 bytes de
+    longitud. Con la semilla de la partida basta para reproducirla entera.
+    """
+    def __init__(self, seed, tick_rate=60):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.runs = []  # [[bits, repeticiones], ...]
+        self.ticks = 0
+
+    def record(self, bits):
+        if self.runs and self.runs[-1][0] == bits:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+        self.ticks += 1
+
+    def to_bytes(self):
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate, self.ticks))
+        for bits, count in self.runs:
+            out.append(bits)
+            _write_varint(out, count)
+        return bytes(out)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class Replay:
+    """Grabación cargada: semilla, ticks por segundo y la entrada de cada tick."""
+    def __init__(self, seed, tick_rate, runs):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.runs = runs
+        self.ticks = sum(count for _, count in runs)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, tick_rate, ticks = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("no es una grabación válida")
+        runs = []
+        pos = _HEADER.size
+        while pos < len(data):
+            bits = data[pos]
+            count, pos = _read_varint(data, pos + 1)
+            runs.append((bits, count))
+        replay = cls(seed, tick_rate, runs)
+        if replay.ticks != ticks:
+            raise ValueError("grabación incompleta")
+        return replay
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def __len__(self):
+        return self.ticks
+
+    def __iter__(self):
+        """Bits de entrada de cada tick, en orden."""
+        for bits, count in self.runs:
+            for _ in range(count):
+                yield bits
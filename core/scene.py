@@ -0,0 +1,56 @@
+import pygame # pyright: ignore[reportMissingImports]
+
+class Scene:
+    """Registro de grupos de la escena.
+
+    Todos los sprites viven en un único LayeredUpdates que se actualiza y
+    dibuja una sola vez por frame (ordenado por capa). Los grupos por tipo
+    (balas, enemigos, ...) solo sirven para consultas y colisiones.
+    """
+    def __init__(self):
+        self.sprites = pygame.sprite.LayeredUpdates()
+        self.groups = {}
+        self.layers = {}
+
+    def group(self, name, layer=0):
+        """Registra (o devuelve) el grupo `name` dibujado en la capa `layer`."""
+        if name not in self.groups:
+            self.groups[name] = pygame.sprite.Group()
+            self.layers[name] = layer
+        return self.groups[name]
+
+    def add(self, name, *sprites):
+        """Añade los sprites a la escena y a su grupo por tipo."""
+        self.sprites.add(*sprites, layer=self.layers[name])
+        self.groups[name].add(*sprites)
+        for sprite in sprites:
+            sprite.prev_pos = sprite.rect.topleft
+
+    def update(self, *args):
+        self.sprites.update(*args)
+
+    def snapshot(self):
+        """Guarda la posición de cada sprite antes de un tick (para interpolar el dibujo)."""
+        for sprite in self.sprites:
+            sprite.prev_pos = sprite.rect.topleft
+
+    def render_pos(self, sprite, alpha):
+        """Posición de dibujo interpolada entre el tick anterior y el actual."""
+        x, y = sprite.rect.topleft
+        px, py = sprite.prev_pos
+        return (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+
+    def draw(self, surface, alpha=1.0):
+        if alpha >= 1.0:
+            return self.sprites.draw(surface)
+        pos = self.render_pos
+        return surface.blits([(s.image, pos(s, alpha)) for s in self.sprites.sprites()])
+
+    def empty(self):
+        self.sprites.empty()
+        for g in self.groups.values():
+            g.empty()
+
+    def counts(self):
+        """Número de sprites por grupo (útil para depurar y perfilar)."""
+        return {name: len(g) for name, g in self.groups.items()}
@@ -5,9 +5,29 @@ WIDTH = 800
 HEIGHT = 600
 FPS = 60
 
+# Salida: la simulación usa siempre WIDTH x HEIGHT. Con INTERNAL_RESOLUTION (p. ej. (400, 300))
+# se dibuja en un lienzo de ese tamaño que se presenta escalado a la ventana (WINDOW_SIZE,
+# None = WIDTH x HEIGHT) o a pantalla completa. SCALE_MODE: "integer" o "smooth".
+INTERNAL_RESOLUTION = None
+WINDOW_SIZE = None
+FULLSCREEN = False
+SCALE_MODE = "smooth"
+
+# Tamaño en pantalla de los sprites de entities/ (los PNG miden 1024-1536 px)
+PLAYER_SIZE = (64, 64)
+ENEMY_SIZE = (38, 56)
+TREASURE_SIZE = (56, 38)
+TRAP_SIZE = (38, 56)
+
 # Colores básicos (RGB)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
+
+# Colisiones: "rect" (cajas) o "mask" (píxel a píxel con máscaras cacheadas)
+COLLISION_MODE = "rect"
+
+# Entidades de core/game.py: "sprites" (un Sprite por objeto) o "ecs" (arrays NumPy por componente)
+ENTITY_BACKEND = "sprites"
@@ -0,0 +1,79 @@
+import numpy as np
+
+class ArrayStore:
+    """Base de los almacenes por arrays (estructura de arrays con NumPy).
+
+    Cada nombre de FIELDS es un array de `capacity` elementos; los elementos
+    vivos ocupan siempre el prefijo [0, count) en orden de creación y al
+    eliminar se compacta conservando ese orden. Los tipos visuales son
+    imágenes compartidas: `kind` guarda el índice en `images`. FIELDS debe
+    incluir x, y, vx, vy y kind (los usa draw).
+    """
+    FIELDS = ()
+
+    def __init__(self, width, height, capacity):
+        self.width = width
+        self.height = height
+        self.count = 0
+        self.capacity = capacity
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.kinds = {}
+        self.images = []
+
+    def __len__(self):
+        return self.count
+
+    def kind_id(self, key):
+        """Id del tipo visual `key`; su imagen la crea make_image(key) la primera vez."""
+        k = self.kinds.get(key)
+        if k is None:
+            k = self.kinds[key] = len(self.images)
+            self.images.append(self.make_image(key))
+        return k
+
+    def make_image(self, key):
+        raise NotImplementedError
+
+    def _reserve(self, n):
+        needed = self.count + n
+        if needed <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name, dtype in self.FIELDS:
+            arr = np.zeros(capacity, dtype=dtype)
+            arr[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def _keep(self, keep):
+        """Conserva solo los elementos con keep[i] == True (en orden)."""
+        n = self.count
+        k = int(np.count_nonzero(keep))
+        if k == n:
+            return
+        for name, _ in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.count = k
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surface, alpha=1.0):
+        """Dibuja todo en orden de creación (interpolado hacia el tick anterior si alpha < 1) y devuelve los rects."""
+        n = self.count
+        if not n:
+            return []
+        images = self.images
+        if alpha < 1.0:
+            back = 1.0 - alpha
+            xs = (self.x[:n] - self.vx[:n] * back).tolist()
+            ys = (self.y[:n] - self.vy[:n] * back).tolist()
+        else:
+            xs = self.x[:n].tolist()
+            ys = self.y[:n].tolist()
+        return surface.blits([(images[k], (int(px), int(py))) for k, px, py in
+                              zip(self.kind[:n].tolist(), xs, ys)])
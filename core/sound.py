@@ -0,0 +1,79 @@
+from collections import Counter
+
+import pygame # pyright: ignore[reportMissingImports]
+
+class SoundManager:
+    """Reproduce efectos con límites de voces, sobre canales reservados por categoría.
+
+    Cada categoría (jugador, enemigos, jefe, interfaz...) tiene sus propios
+    canales del mixer, así los disparos enemigos no pueden quitarle canales
+    al resto. Por cada sonido se limita cuántas copias suenan a la vez
+    (`max_voices`) y cada cuánto puede volver a sonar (`cooldown_ms`). Si el
+    mismo sonido se pide varias veces en un frame solo suena una vez
+    (se "fusiona"). `stats` cuenta lo reproducido, fusionado y descartado.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.pools = {}
+        self.sounds = {}
+        self.now = 0
+        self._frame = set()
+        self.stats = Counter()
+
+    def setup(self, pools):
+        """Reserva canales: `pools` es {categoría: nº de canales}. Requiere el mixer iniciado."""
+        total = sum(pools.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)  # Sound.play() sin canal no puede quitárselos
+        first = 0
+        self.pools = {}
+        for category, n in pools.items():
+            self.pools[category] = [pygame.mixer.Channel(i) for i in range(first, first + n)]
+            first += n
+        self.enabled = True
+
+    def register(self, name, sound, category, max_voices=1, cooldown_ms=0, volume=None):
+        """Da de alta `sound` (puede ser None: entonces play(name) no hace nada)."""
+        if sound is not None and volume is not None:
+            sound.set_volume(volume)
+        self.sounds[name] = (sound, category, max_voices, cooldown_ms, [-cooldown_ms])
+
+    def tick(self, now_ms):
+        """Empieza un frame nuevo (para fusionar repeticiones y medir enfriamientos)."""
+        self.now = now_ms
+        self._frame.clear()
+
+    def play(self, name):
+        entry = self.sounds.get(name)
+        if not self.enabled or entry is None or entry[0] is None:
+            return False
+        sound, category, max_voices, cooldown_ms, last = entry
+        if name in self._frame:
+            self.stats["merged"] += 1
+            return False
+        self._frame.add(name)
+        if self.now - last[0] < cooldown_ms:
+            self.stats["dropped_cooldown"] += 1
+            return False
+        free = None
+        voices = 0
+        for ch in self.pools[category]:
+            if ch.get_busy():
+                if ch.get_sound() is sound:
+                    voices += 1
+            elif free is None:
+                free = ch
+        if voices >= max_voices:
+            self.stats["dropped_voices"] += 1
+            return False
+        if free is None:
+            self.stats["dropped_no_channel"] += 1
+            return False
+        free.play(sound)
+        last[0] = self.now
+        self.stats["played"] += 1
+        return True
+
+    def dropped(self):
+        """Total de peticiones que no sonaron (fusionadas o descartadas)."""
+        return sum(v for k, v in self.stats.items() if k != "played")
@@ -0,0 +1,84 @@
+class SpatialHash:
+    """Rejilla uniforme para colisiones rect-rect (broadphase).
+
+    Se reconstruye una vez por frame con `rebuild(group)` y luego responde
+    `spritecollide` / `groupcollide` con la misma semántica que las
+    funciones de pygame.sprite, pero probando solo los sprites de las
+    celdas cercanas a cada rect en lugar de todo el grupo.
+
+    Cada sprite se guarda una sola vez, en la celda de su esquina superior
+    izquierda; las consultas amplían su rango con el tamaño máximo indexado.
+    La prueba fina dentro de cada celda usa Rect.collidelistall (en C);
+    con `collided` (como en pygame) esa función solo se llama para los
+    pares cuyos rects ya chocan (p. ej. una prueba por máscara).
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.sprites = []
+        self.group = None
+        self.max_w = 0
+        self.max_h = 0
+
+    def rebuild(self, group):
+        """Indexa todos los sprites de `group` por celda."""
+        cs = self.cell_size
+        cells = {}
+        sprites = group.sprites()
+        max_w = max_h = 0
+        for i, sprite in enumerate(sprites):
+            r = sprite.rect
+            key = (r.x // cs, r.y // cs)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = ([i], [r])
+            else:
+                bucket[0].append(i)
+                bucket[1].append(r)
+            if r.w > max_w: max_w = r.w
+            if r.h > max_h: max_h = r.h
+        self.cells = cells
+        self.sprites = sprites
+        self.group = group
+        self.max_w = max_w
+        self.max_h = max_h
+
+    def query(self, rect):
+        """Sprites indexados cuyo rect choca con `rect`, en el orden del grupo."""
+        cs = self.cell_size
+        cells = self.cells
+        hits = []
+        for cx in range((rect.x - self.max_w + 1) // cs, (rect.right - 1) // cs + 1):
+            for cy in range((rect.y - self.max_h + 1) // cs, (rect.bottom - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    order = bucket[0]
+                    hits.extend(order[i] for i in rect.collidelistall(bucket[1]))
+        if not hits:
+            return hits
+        hits.sort()
+        group = self.group
+        sprites = self.sprites
+        # Los sprites eliminados después de rebuild() ya no cuentan.
+        return [sprites[i] for i in hits if sprites[i] in group]
+
+    def spritecollide(self, sprite, dokill=False, collided=None):
+        """Equivalente a pygame.sprite.spritecollide(sprite, group, dokill, collided)."""
+        crashed = self.query(sprite.rect)
+        if collided is not None and crashed:
+            crashed = [other for other in crashed if collided(sprite, other)]
+        if dokill:
+            for other in crashed:
+                other.kill()
+        return crashed
+
+    def groupcollide(self, groupa, dokilla=False, dokillb=False, collided=None):
+        """Equivalente a pygame.sprite.groupcollide(groupa, group, dokilla, dokillb, collided)."""
+        crashed = {}
+        for sprite in groupa.sprites():
+            collision = self.spritecollide(sprite, dokillb, collided)
+            if collision:
+                crashed[sprite] = collision
+                if dokilla:
+                    sprite.kill()
+        return crashed
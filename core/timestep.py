@@ -0,0 +1,45 @@
+class SimClock:
+    """Reloj de la simulación en ms: avanza un tick fijo por paso, no con el tiempo real.
+
+    Sustituye a pygame.time.get_ticks() en la lógica del juego para que los
+    temporizadores (power-ups, disparos, pausas entre oleadas) sean
+    deterministas y no dependan de los FPS.
+    """
+    def __init__(self, tick_rate=60):
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000.0 / tick_rate
+        self.ticks = 0
+
+    def advance(self):
+        self.ticks += 1
+
+    def now(self):
+        return int(self.ticks * self.tick_ms)
+
+
+class FixedTimestep:
+    """Acumulador de paso fijo: cuántos ticks de simulación tocan por frame renderizado.
+
+    `advance(frame_ms)` suma el tiempo real del frame y devuelve el número de
+    ticks a simular; `alpha` (0..1) es la fracción del siguiente tick ya
+    transcurrida, para interpolar el dibujo. Se limita a `max_steps` ticks
+    por frame para que un frame muy lento no congele el juego (espiral de la
+    muerte); en ese caso la simulación va más lenta que el tiempo real.
+    """
+    def __init__(self, tick_rate=60, max_steps=5):
+        self.dt = 1000.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        self.accumulator += min(frame_ms, self.dt * self.max_steps)
+        steps = int(self.accumulator // self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
+    def reset(self):
+        self.accumulator = 0.0
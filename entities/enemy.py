@@ -1,13 +1,14 @@
 import pygame, random # pyright: ignore[reportMissingImports]
 from core import settings
+from core.assets import assets
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, enemy_type="ground"):
         super().__init__()
         if enemy_type == "ground":
-            self.image = pygame.image.load("assets/enemy_ground.png").convert_alpha()
+            self.image = assets.image("assets/enemy_ground.png", settings.ENEMY_SIZE)
         else:
-            self.image = pygame.image.load("assets/enemy_flying.png").convert_alpha()
+            self.image = assets.image("assets/enemy_flying.png", settings.ENEMY_SIZE)
         self.rect = self.image.get_rect(center=(x, y))
 
         # Atributos
@@ -22,3 +23,12 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.y += self.speed
         if self.rect.top > settings.HEIGHT:
             self.kill()
+
+
+def spawn_enemy(store, x, y, enemy_type="ground"):
+    """Igual que Enemy(x, y, enemy_type) pero como entidad de un EntityStore"""
+    if enemy_type == "ground":
+        image = assets.image("assets/enemy_ground.png", settings.ENEMY_SIZE)
+    else:
+        image = assets.image("assets/enemy_flying.png", settings.ENEMY_SIZE)
+    return store.spawn("enemy", image, (x, y), vy=random.randint(1, 3), hp=50, damage=5)
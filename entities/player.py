@@ -1,10 +1,11 @@
 import pygame # pyright: ignore[reportMissingImports]
 from core import settings
+from core.assets import assets
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.image.load("assets/player.png").convert_alpha()
+        self.image = assets.image("assets/player.png", settings.PLAYER_SIZE)
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = 5
 
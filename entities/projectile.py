@@ -1,11 +1,21 @@
 import pygame # pyright: ignore[reportMissingImports]
 from core import settings
 
+_IMAGE = None
+
+def projectile_image():
+    """Imagen compartida por todos los proyectiles (una sola Surface y una sola máscara)"""
+    global _IMAGE
+    if _IMAGE is None:
+        _IMAGE = pygame.Surface((5, 15))
+        _IMAGE.fill(settings.RED)
+    return _IMAGE
+
+
 class Projectile(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((5, 15))
-        self.image.fill(settings.RED)
+        self.image = projectile_image()
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = -8
 
@@ -13,3 +23,8 @@ class Projectile(pygame.sprite.Sprite):
         self.rect.y += self.speed
         if self.rect.bottom < 0:
             self.kill()
+
+
+def spawn_projectile(store, x, y):
+    """Igual que Projectile(x, y) pero como entidad de un EntityStore (imagen compartida)"""
+    return store.spawn("projectile", projectile_image(), (x, y), vy=-8)
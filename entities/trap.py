@@ -1,19 +1,43 @@
 import pygame # pyright: ignore[reportMissingImports]
 from core import settings
+from core.assets import assets
+from core.aoe import RadiusIndex
 
 class Trap(pygame.sprite.Sprite):
     def __init__(self, x, y, damage=30, radius=50):
         super().__init__()
-        self.image = pygame.image.load("assets/trap.png").convert_alpha()
+        self.image = assets.image("assets/trap.png", settings.TRAP_SIZE)
         self.rect = self.image.get_rect(center=(x, y))
         self.damage = damage
         self.radius = radius
 
-    def explode(self, group_enemies):
+    def blast(self):
+        """La explosión como (x, y, radio, daño) para RadiusIndex.damage_many"""
+        return (self.rect.centerx, self.rect.centery, self.radius, self.damage)
+
+    def explode(self, group_enemies, index=None):
         """Explosión que afecta a enemigos dentro del radio"""
-        hits = [enemy for enemy in group_enemies if self.rect.centerx - self.radius < enemy.rect.centerx < self.rect.centerx + self.radius]
-        for enemy in hits:
-            enemy.hp -= self.damage
-            if enemy.hp <= 0:
-                enemy.kill()
-        self.kill()
+        explode_traps([self], group_enemies, index)
+
+
+def explode_traps(traps, group_enemies, index=None):
+    """Hace explotar varias trampas a la vez con una sola consulta al índice.
+
+    `index` es un RadiusIndex ya reconstruido sobre `group_enemies` en este
+    frame; si no se pasa se crea uno.
+    """
+    if index is None:
+        index = RadiusIndex()
+        index.rebuild(group_enemies)
+    hits = index.damage_many([trap.blast() for trap in traps])
+    for enemy, damage in hits.items():
+        enemy.hp -= damage
+        if enemy.hp <= 0:
+            enemy.kill()
+    for trap in traps:
+        trap.kill()
+
+
+def spawn_trap(store, x, y, damage=30):
+    """Igual que Trap(x, y, damage) pero como entidad de un EntityStore"""
+    return store.spawn("trap", assets.image("assets/trap.png", settings.TRAP_SIZE), (x, y), damage=damage)
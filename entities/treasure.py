@@ -1,10 +1,11 @@
 import pygame # pyright: ignore[reportMissingImports]
 from core import settings
+from core.assets import assets
 
 class Treasure(pygame.sprite.Sprite):
     def __init__(self, x, y, value=100):
         super().__init__()
-        self.image = pygame.image.load("assets/treasure.png").convert_alpha()
+        self.image = assets.image("assets/treasure.png", settings.TREASURE_SIZE)
         self.rect = self.image.get_rect(center=(x, y))
         self.value = value  # valor monetario o puntaje
 
@@ -13,3 +14,8 @@ class Treasure(pygame.sprite.Sprite):
         self.rect.y += 2
         if self.rect.top > settings.HEIGHT:
             self.kill()
+
+
+def spawn_treasure(store, x, y, value=100):
+    """Igual que Treasure(x, y, value) pero como entidad de un EntityStore"""
+    return store.spawn("treasure", assets.image("assets/treasure.png", settings.TREASURE_SIZE), (x, y), vy=2, value=value)
@@ -5,18 +5,124 @@ import random
 import sys
 import os
 import math
+import time
 from math import ceil
-
-# Inicializar pygame (video y fuentes)
-pygame.init()
-
-# Intentar inicializar el mixer de forma segura (no detener ejecución si falla)
-mixer_ok = True
+from core.scene import Scene
+from core.spatial_hash import SpatialHash
+from core.pool import SpritePool, PooledSprite
+from core.fire_scheduler import FireScheduler
+from core.timestep import SimClock, FixedTimestep
+from core.dirty import DirtyRects, CachedText
+from core.assets import assets
+from core.effects import effects
+from core.masks import collide_mask
+from core.bake import ensure_baked
+from core.preload import AssetPreloader
+from core.sound import SoundManager
+from core.profiler import FrameProfiler, PerfOverlay
+from core.replay import ReplayRecorder, Replay
+from core.quality import QualityGovernor
+from core.gpu import create_canvas
+from core.canvas import create_scaled_canvas
+
+# NumPy es opcional: acelera el fondo de estrellas y habilita el motor de proyectiles por arrays
 try:
-    pygame.mixer.init()
-except Exception as e:
-    print(f"[ADVERTENCIA] No se pudo inicializar el mixer: {e}")
-    mixer_ok = False
+    import numpy as np
+except ImportError:
+    np = None
+if np is not None:
+    from core.projectiles import ProjectileEngine, OWNER_PLAYER, OWNER_ENEMY
+
+# --------------------------------------------------
+WIDTH, HEIGHT = 1280, 720
+WIN = None              # ventana; la crea init_display()
+FPS = 60                # ticks de simulación por segundo (toda la lógica avanza a este ritmo)
+# Límite de FPS de dibujo: None = frecuencia de refresco de la pantalla (FPS si no se conoce);
+# 0 = sin límite (solo para medir: el bucle ocupa una CPU entera).
+RENDER_FPS = None
+# "full": se repinta y hace flip de toda la pantalla; "dirty": fondo fijo y display.update(rects)
+# solo con lo que cambió (para despliegues con render por software).
+RENDER_MODE = "full"
+# Backend de dibujo: "software" (Surfaces + display.flip) o "gpu" (texturas con pygame._sdl2.video;
+# si no se puede crear el renderer se vuelve a "software"). GPU_ACCELERATED: -1 el mejor renderer
+# disponible, 1 solo GPU, 0 el renderer por software de SDL (para probar en máquinas sin GPU).
+RENDER_BACKEND = "software"
+GPU_ACCELERATED = -1
+# Resolución de salida. La simulación usa siempre WIDTH x HEIGHT; con INTERNAL_RESOLUTION (p. ej.
+# (640, 360) o (960, 540)) se dibuja en un lienzo de ese tamaño que se presenta escalado a la ventana
+# (WINDOW_SIZE, None = WIDTH x HEIGHT) o a pantalla completa. SCALE_MODE: "integer" (múltiplos
+# enteros, píxeles nítidos) o "smooth". Con el backend GPU el renderer escala y la resolución
+# interna no se usa.
+INTERNAL_RESOLUTION = None
+WINDOW_SIZE = None
+FULLSCREEN = False
+SCALE_MODE = "smooth"
+# Profiler por fases: F3 muestra/oculta el overlay (y empieza a medir). Al terminar la partida
+# se exporta la sesión medida a PROFILE_EXPORT_DIR (CSV + JSON); None para no exportar.
+PROFILE = False
+PROFILE_EXPORT_DIR = "profiles"
+profiler = FrameProfiler(enabled=PROFILE)
+# Gobernador de calidad: si el tiempo de frame supera el presupuesto baja estrellas, estela y
+# mezcla del fondo (y los recupera cuando sobra margen). Nunca toca la simulación.
+QUALITY_AUTO = True
+QUALITY_LOG_PATH = "profiles/quality.csv"   # None para no guardar los cambios de nivel
+
+# ------------------------- INICIALIZACIÓN -------------------------
+def init_display(headless=False):
+    """Inicializa pygame y crea la ventana. En modo headless usa los drivers 'dummy' (sin ventana ni audio)."""
+    global WIN
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    title = "Space Adventure - Fondo Simple y Elegante + Ráfaga"
+    WIN = None
+    if RENDER_BACKEND == "gpu" and not headless:
+        WIN = create_canvas((WIDTH, HEIGHT), title, accelerated=GPU_ACCELERATED,
+                            window_size=WINDOW_SIZE, fullscreen=FULLSCREEN)
+    if WIN is None:
+        if not headless and (INTERNAL_RESOLUTION or WINDOW_SIZE or FULLSCREEN):
+            WIN = create_scaled_canvas((WIDTH, HEIGHT), INTERNAL_RESOLUTION, WINDOW_SIZE, FULLSCREEN, SCALE_MODE)
+        else:
+            WIN = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption(title)
+    return WIN
+
+def render_fps():
+    """Límite de FPS de dibujo efectivo según RENDER_FPS."""
+    if RENDER_FPS is not None:
+        return RENDER_FPS
+    # get_current_refresh_rate solo existe en pygame-ce; con pygame se limita a FPS
+    get_rate = getattr(pygame.display, "get_current_refresh_rate", None)
+    rate = get_rate() if get_rate is not None else 0
+    return rate if rate > 0 else FPS
+
+mixer_ok = False
+# Efectos de sonido: sin mixer (o en modo headless) sounds.play() no hace nada
+sounds = SoundManager()
+# Canales del mixer reservados por categoría (8 en total, como el mixer por defecto)
+SOUND_CHANNELS = {"player": 2, "enemy": 3, "boss": 2, "ui": 1}
+
+def init_sound():
+    """Inicializa el mixer y carga los sonidos (no detiene la ejecución si falla)."""
+    global mixer_ok
+    # Intentar inicializar el mixer de forma segura (no detener ejecución si falla)
+    mixer_ok = True
+    try:
+        pygame.mixer.init()
+    except Exception as e:
+        print(f"[ADVERTENCIA] No se pudo inicializar el mixer: {e}")
+        mixer_ok = False
+
+    if mixer_ok:
+        sounds.setup(SOUND_CHANNELS)
+
+    # Carga los sonidos disponibles (pueden ser None si faltan o mixer no disponible)
+    # nombre, archivo, categoría, voces simultáneas, enfriamiento (ms), volumen
+    sounds.register("shoot", load_sound("assets/sounds/shoot.wav"), "player", max_voices=2, cooldown_ms=60, volume=0.4)
+    sounds.register("enemy_shoot", load_sound("assets/sounds/shoot_enemy.wav"), "enemy", max_voices=3, cooldown_ms=50, volume=0.5)
+    sounds.register("final_boss_shoot", load_sound("assets/sounds/shoot_final_boss.wav"), "boss", max_voices=2, cooldown_ms=200, volume=0.6)
+    sounds.register("powerup", load_sound("assets/sounds/powerup.wav"), "ui", max_voices=1, volume=0.5)
 
 # Función auxiliar para cargar sonidos de forma segura
 def load_sound(path):
@@ -32,25 +138,6 @@ def load_sound(path):
         print(f"[ADVERTENCIA] No se encontró el sonido: {path}")
         return None
 
-# Carga los sonidos disponibles (pueden ser None si faltan o mixer no disponible)
-snd_shoot = load_sound("assets/sounds/shoot.wav")
-snd_enemy_shoot = load_sound("assets/sounds/shoot_enemy.wav")
-snd_final_boss_shoot = load_sound("assets/sounds/shoot_final_boss.wav")
-snd_powerup = load_sound("assets/sounds/powerup.wav")
-
-# Ajustar volumen (si existen)
-if snd_shoot: snd_shoot.set_volume(0.4)
-if snd_enemy_shoot: snd_enemy_shoot.set_volume(0.5)
-if snd_final_boss_shoot: snd_final_boss_shoot.set_volume(0.6)
-if snd_powerup: snd_powerup.set_volume(0.5)
-
-# --------------------------------------------------
-WIDTH, HEIGHT = 1280, 720
-WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Space Adventure - Fondo Simple y Elegante + Ráfaga")
-CLOCK = pygame.time.Clock()
-FPS = 60
-
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 
@@ -58,27 +145,185 @@ BLACK = (0, 0, 0)
 def load_image(path, size=None):
     """Carga una imagen si existe; devuelve None si no."""
     if os.path.exists(path):
-        img = pygame.image.load(path).convert_alpha()
-        if size:
-            img = pygame.transform.smoothscale(img, size)
-        return img
+        return assets.image(path, size)  # compartida: no modificar la Surface devuelta
     return None
 
 # ------------------------- FONDO (estrellas + planetas) -------------------------
-class SimpleStarfield:
-    def __init__(self, width, height, num_stars=120, num_planets=2):
+class StarList:
+    """Estrellas como listas [x, y, speed, size, bright]; se dibujan una a una."""
+    def __init__(self, width, height, num_stars, rand=random):
         self.width = width
         self.height = height
+        self.rand = rand
         self.stars = [
-            [random.uniform(0, width), random.uniform(0, height),
-             random.uniform(0.15, 1.2), random.randint(1, 3),
-             random.randint(150, 240)]
+            [rand.uniform(0, width), rand.uniform(0, height),
+             rand.uniform(0.15, 1.2), rand.randint(1, 3),
+             rand.randint(150, 240)]
             for _ in range(num_stars)
         ]
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+
+    def update(self, vertical_speed_factor=1.0):
+        for s in self.stars:
+            s[1] += s[2] * vertical_speed_factor
+            if s[1] > self.height:
+                s[0] = self.rand.uniform(0, self.width)
+                s[1] = -1.0
+                s[2] = self.rand.uniform(0.15, 1.2)
+                s[3] = self.rand.randint(1, 3)
+                s[4] = self.rand.randint(150, 240)
+
+    def draw(self, surf, count=None):
+        # usar bright en las tres componentes; `count` limita cuántas se dibujan
+        if not isinstance(surf, pygame.Surface):  # backend GPU: sin pygame.draw, con sprites
+            surf.blits([(star_stamp(size, int(bright)), (int(sx) - size - 1, int(sy % self.height) - size - 1))
+                        for sx, sy, spd, size, bright in self.stars[:count]], doreturn=False)
+            return
+        for sx, sy, spd, size, bright in self.stars[:count]:
+            y = (sy % self.height)  # Wrap Y para movimiento continuo.
+            if y < 0: y += self.height  # Asegura Y positiva.
+            c = max(0, min(255, int(bright)))
+            color = (c, c, c)
+            pygame.draw.circle(surf, color, (int(sx), int(y)), size)
+
+
+_STAR_STAMPS = {}
+
+def star_stamp(size, bright):
+    """Sprite de una estrella (círculo gris de radio `size`), cacheado por tamaño y brillo."""
+    stamp = _STAR_STAMPS.get((size, bright))
+    if stamp is None:
+        stamp = pygame.Surface((2*size + 3, 2*size + 3), pygame.SRCALPHA)
+        pygame.draw.circle(stamp, (bright, bright, bright), (size + 1, size + 1), size)
+        _STAR_STAMPS[(size, bright)] = stamp
+    return stamp
+
+
+STAR_DTYPE = [("x", "f4"), ("y", "f4"), ("speed", "f4"), ("size", "u1"), ("bright", "u1")]
+
+class StarArrays:
+    """Estrellas en un array estructurado de NumPy; se mueven y dibujan por lotes."""
+    _offsets = {}  # size -> (dx, dy) de los píxeles que pinta pygame.draw.circle
+
+    def __init__(self, width, height, num_stars, seed=None):
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.stars = np.zeros(num_stars, dtype=STAR_DTYPE)
+        self._respawn(np.arange(num_stars))
+        self.stars["y"] = self.rng.uniform(0, height, num_stars)
+        self._lut = None
+        self._lut_key = None
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+
+    def _respawn(self, idx):
+        n = len(idx)
+        s = self.stars
+        s["x"][idx] = self.rng.uniform(0, self.width, n)
+        s["y"][idx] = -1.0
+        s["speed"][idx] = self.rng.uniform(0.15, 1.2, n)
+        s["size"][idx] = self.rng.integers(1, 4, n)
+        s["bright"][idx] = self.rng.integers(150, 241, n)
+
+    def update(self, vertical_speed_factor=1.0):
+        s = self.stars
+        s["y"] += s["speed"] * vertical_speed_factor
+        dead = np.flatnonzero(s["y"] > self.height)
+        if dead.size:
+            self._respawn(dead)
+
+    @classmethod
+    def _circle_offsets(cls, size):
+        """Píxeles relativos al centro que cubre un círculo de radio `size`."""
+        offs = cls._offsets.get(size)
+        if offs is None:
+            stamp = pygame.Surface((2*size + 3, 2*size + 3))
+            stamp.fill((0, 0, 0))
+            pygame.draw.circle(stamp, (255, 255, 255), (size + 1, size + 1), size)
+            pts = np.argwhere(pygame.surfarray.array2d(stamp) != 0) - (size + 1)
+            offs = (pts[:, 0].astype(np.int32), pts[:, 1].astype(np.int32))
+            cls._offsets[size] = offs
+        return offs
+
+    def _positions(self, s):
+        xs = s["x"].astype(np.int32)
+        ys = np.mod(s["y"], self.height).astype(np.int32)  # Wrap Y para movimiento continuo.
+        return xs, ys
+
+    def draw(self, surf, count=None):
+        """Dibuja las `count` primeras estrellas (todas si es None)."""
+        stars = self.stars[:count]
+        if not isinstance(surf, pygame.Surface) or surf.get_bytesize() != 4:
+            self._draw_stamps(surf, stars)
+            return
+        w, h = surf.get_size()
+        stride = surf.get_pitch() // 4
+        lut = self._color_lut(surf)
+        xs, ys = self._positions(stars)
+        sizes = stars["size"]
+        bright = stars["bright"]
+        # Vista lineal de los píxeles (uint32): una escritura por píxel en lugar de tres canales.
+        pixels = np.frombuffer(surf.get_view("1"), dtype=np.uint32)
+        m = int(sizes.max()) + 1 if len(sizes) else 0
+        # Las estrellas lejos del borde no necesitan recorte por píxel.
+        interior = (xs >= m) & (xs < w - m) & (ys >= m) & (ys < h - m)
+        base = ys * stride + xs
+        for size in np.unique(sizes):
+            dx, dy = self._circle_offsets(int(size))
+            of_size = sizes == size
+            sel = np.flatnonzero(of_size & interior)
+            pixels[base[sel, None] + (dy * stride + dx)] = lut[bright[sel]][:, None]
+            sel = np.flatnonzero(of_size & ~interior)
+            if sel.size:
+                X = (xs[sel, None] + dx).ravel()
+                Y = (ys[sel, None] + dy).ravel()
+                C = np.repeat(lut[bright[sel]], len(dx))
+                inside = (X >= 0) & (X < w) & (Y >= 0) & (Y < h)
+                pixels[Y[inside] * stride + X[inside]] = C[inside]
+        del pixels  # libera el bloqueo de la superficie
+
+    def _color_lut(self, surf):
+        """Tabla brillo -> color gris ya mapeado al formato de píxel de `surf`."""
+        key = (surf.get_masks(), surf.get_shifts())
+        if self._lut_key != key:
+            self._lut = np.array([surf.map_rgb((c, c, c)) for c in range(256)], dtype=np.uint32)
+            self._lut_key = key
+        return self._lut
+
+    def _draw_stamps(self, surf, stars):
+        """Alternativa sin surfarray (o sin píxeles, backend GPU): sprites de estrella + blits."""
+        xs, ys = self._positions(stars)
+        surf.blits([(star_stamp(size, bright), (x - size - 1, y - size - 1)) for x, y, size, bright in
+                    zip(xs.tolist(), ys.tolist(), stars["size"].tolist(), stars["bright"].tolist())],
+                   doreturn=False)
+
+
+class SimpleStarfield:
+    def __init__(self, width, height, num_stars=120, num_planets=2, backend="auto", seed=None):
+        self.width = width
+        self.height = height
+        # RNG propio: el fondo es cosmético y no debe consumir el RNG de la partida.
+        self.rng = random.Random(seed)
+        if backend == "auto":
+            backend = "numpy" if np is not None else "list"
+        if backend == "numpy" and np is None:
+            print("[ADVERTENCIA] NumPy no está instalado; se usan estrellas en listas.")
+            backend = "list"
+        self.backend = backend
+        if backend == "numpy":
+            self.star_layer = StarArrays(width, height, num_stars, seed=seed)
+        else:
+            self.star_layer = StarList(width, height, num_stars, self.rng)
         pal = [(12, 18, 36), (40, 18, 60), (80, 24, 28), (50, 30, 10)]
         self.planets = [
-            [random.uniform(80, width - 80), random.uniform(60, height//2),
-             random.randint(36, 80), random.choice(pal), random.uniform(0.02, 0.12)]
+            [self.rng.uniform(80, width - 80), self.rng.uniform(60, height//2),
+             self.rng.randint(36, 80), self.rng.choice(pal), self.rng.uniform(0.02, 0.12)]
             for _ in range(num_planets)
         ]
         self.osc_angle = 0.0
@@ -88,11 +333,86 @@ class SimpleStarfield:
         self.current_color = self.palette[0]
         self.target_color = self.palette[0]
         self.color_t = 1.0
-        self.bg_img = load_image("assets/background11.png")
-        if self.bg_img:
-            self.bg_img = pygame.transform.smoothscale(self.bg_img, (width, height))
+        self.bg_path = "assets/background11.png"
+        self.bg_img = load_image(self.bg_path, (width, height))  # ya escalado (horneado si está en el paquete)
         self.y_offset = 0.0
         self.scroll_speed = 0.6
+        # Caché de capas pre-renderizadas (se reconstruye solo si cambia el tamaño o el color)
+        self._layers_size = None
+        self._grad = None
+        self._bg_alpha = None
+        self._tile = None
+        self._tile_color = None
+        self._planet_sprites = {}
+        # Calidad visual (la ajusta apply_quality); no afecta a la actualización del fondo
+        self.num_stars = num_stars
+        self.visible_stars = num_stars
+        self.blend = True
+        self.show_planets = True
+
+    def apply_quality(self, tier):
+        """Aplica un QualityTier: estrellas dibujadas, mezcla del fondo y planetas."""
+        self.visible_stars = int(self.num_stars * tier.stars)
+        self.blend = tier.blend
+        self.show_planets = tier.planets
+
+    def resize(self, width, height):
+        """Cambia el tamaño del fondo e invalida la caché de capas."""
+        if (width, height) == (self.width, self.height):
+            return
+        self.width = width
+        self.height = height
+        self.star_layer.resize(width, height)
+        self.bg_img = load_image(self.bg_path, (width, height))
+        self._layers_size = None
+
+    def _build_layers(self):
+        """Pre-renderiza el degradado y el fondo con alfa para el tamaño actual."""
+        size = (self.width, self.height)
+        grad = pygame.Surface(size, pygame.SRCALPHA)
+        for i in range(self.height):
+            a = int(30 * (i / self.height))
+            grad.fill((0, 0, 0, a), rect=(0, i, self.width, 1))
+        self._grad = grad
+
+        self._bg_alpha = None
+        if self.bg_img:
+            self._bg_alpha = self.bg_img.copy()
+            self._bg_alpha.set_alpha(120)
+
+        # Baldosa opaca = color base + fondo con alfa ya mezclados; se repinta solo cuando cambia el color.
+        self._tile = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self._tile = self._tile.convert()
+        self._tile_color = None
+        self._layers_size = size
+
+    def _base_tile(self, target):
+        if self._layers_size != (self.width, self.height):
+            self._build_layers()
+        key = (self.current_color, self.blend)
+        if self._tile_color != key:
+            self._tile.fill(self.current_color)
+            if self._bg_alpha and self.blend:
+                self._tile.blit(self._bg_alpha, (0, 0))
+            self._tile_color = key
+            # Los lienzos GPU / de resolución interna cachean cada Surface ya convertida: se repintó en su sitio
+            forget = getattr(target, "forget", None)
+            if forget is not None:
+                forget(self._tile)
+        return self._tile
+
+    def _planet_sprite(self, pr, col):
+        """Devuelve (y cachea) el sprite de un planeta según su radio y color."""
+        safe_col = tuple(max(0, min(255, int(c))) for c in col)
+        key = (pr, safe_col)
+        planet_s = self._planet_sprites.get(key)
+        if planet_s is None:
+            planet_s = pygame.Surface((pr*2, pr*2), pygame.SRCALPHA)
+            pygame.draw.circle(planet_s, safe_col + (160,), (pr, pr), pr)
+            pygame.draw.circle(planet_s, (255,255,255,30), (int(pr*0.7), int(pr*0.6)), int(pr*0.25))
+            self._planet_sprites[key] = planet_s
+        return planet_s
 
     def set_level(self, level, total_levels):
         idx = min(int((level - 1) / max(1, total_levels - 1) * (len(self.palette) - 1)), len(self.palette) - 1)
@@ -110,83 +430,58 @@ class SimpleStarfield:
         self.y_offset = (self.y_offset + self.scroll_speed * vertical_speed_factor) % self.height
         self.osc_angle += 0.01 * self.osc_speed
 
-        for s in self.stars:
-            s[1] += s[2] * vertical_speed_factor
-            if s[1] > self.height:
-                s[0] = random.uniform(0, self.width)
-                s[1] = -1.0
-                s[2] = random.uniform(0.15, 1.2)
-                s[3] = random.randint(1, 3)
-                s[4] = random.randint(150, 240)
+        self.star_layer.update(vertical_speed_factor)
 
         for p in self.planets:
             p[1] += p[4] * vertical_speed_factor
             p[0] += math.sin(self.osc_angle * 0.3 + p[0]*0.001) * 0.1
             if p[1] > self.height + p[2]:
-                p[0] = random.uniform(80, self.width - 80)
+                p[0] = self.rng.uniform(80, self.width - 80)
                 p[1] = -p[2]
 
     def draw(self, surf):
-        base = pygame.Surface((self.width, self.height))
-        base.fill(self.current_color)
-        surf.blit(base, (0,0))
-
+        tile = self._base_tile(surf)
         if self.bg_img:
-            img = self.bg_img.copy()
-            img.set_alpha(120)
             y_offset_mod = self.y_offset % self.height  # Normaliza a 0-height.
             y1 = int(y_offset_mod) - self.height  # Posición superior (entra desde abajo, pero ajustada para inverso).
             y2 = y1 + self.height  # Segunda copia para seamless.
-            surf.blit(img, (0, y1))
-            surf.blit(img, (0, y2))
-
-        grad = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        for i in range(self.height):
-            a = int(30 * (i / self.height))
-            grad.fill((0, 0, 0, a), rect=(0, i, self.width, 1))
-        surf.blit(grad, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
-
-        for px, py, pr, col, _ in self.planets:
-            y = (py % self.height)  # Wrap Y para que planetas que salen por arriba reaparezcan abajo.
-            safe_col = tuple(max(0, min(255, int(c))) for c in col)
-            planet_s = pygame.Surface((pr*2, pr*2), pygame.SRCALPHA)
-            pygame.draw.circle(planet_s, safe_col + (160,), (pr, pr), pr)
-            pygame.draw.circle(planet_s, (255,255,255,30), (int(pr*0.7), int(pr*0.6)), int(pr*0.25))
-            surf.blit(planet_s, (int(px - pr), int(y - pr)))
-
+            surf.blit(tile, (0, y1))
+            surf.blit(tile, (0, y2))
+        else:
+            surf.blit(tile, (0, 0))
 
-        # usar bright en las tres componentes
+        if self.blend:
+            surf.blit(self._grad, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
 
+        if self.show_planets:
+            for px, py, pr, col, _ in self.planets:
+                y = (py % self.height)  # Wrap Y para que planetas que salen por arriba reaparezcan abajo.
+                surf.blit(self._planet_sprite(pr, col), (int(px - pr), int(y - pr)))
 
-        for sx, sy, spd, size, bright in self.stars:
-            y = (sy % self.height)  # Wrap Y para movimiento continuo.
-            if y < 0: y += self.height  # Asegura Y positiva.
-            c = max(0, min(255, int(bright)))
-            color = (c, c, c)
-            pygame.draw.circle(surf, color, (int(sx), int(y)), size)
+        if self.visible_stars:
+            self.star_layer.draw(surf, self.visible_stars)
 
 
 # ...existing code...
 # ------------------------- SPRITES / CARGA -------------------------
-PLAYER_IMG = load_image("assets/player.png", (64, 64))
-if PLAYER_IMG is None:
-    PLAYER_IMG = pygame.Surface((64, 64), pygame.SRCALPHA)
-    PLAYER_IMG.fill((100, 180, 255))  # fallback visible
-
-ENEMY_GROUND_IMG = load_image("assets/enemy_ground.png", (56, 56))
-if ENEMY_GROUND_IMG is None:
-    ENEMY_GROUND_IMG = pygame.Surface((56, 56), pygame.SRCALPHA)
-    ENEMY_GROUND_IMG.fill((200, 80, 80))  # fallback visible para depuración
-
-ENEMY_FLY_IMG = load_image("assets/enemy_flying.png", (56, 56))
-if ENEMY_FLY_IMG is None:
-    ENEMY_FLY_IMG = pygame.Surface((56, 56), pygame.SRCALPHA)
-    ENEMY_FLY_IMG.fill((200, 160, 60))  # fallback visible para depuración
-
-BOSS_IMG = load_image("assets/final_boss.png", (260, 260))
-if BOSS_IMG is None:
-    BOSS_IMG = pygame.Surface((260, 260), pygame.SRCALPHA)
-    BOSS_IMG.fill((180, 50, 180))  # fallback visible
+PLAYER_IMG = ENEMY_GROUND_IMG = ENEMY_FLY_IMG = None
+POWER_DOUBLE_IMG = POWER_HEAL_IMG = POWER_FAST_IMG = POWER_SHIELD_IMG = POWER_RAFAGA_IMG = None
+
+# Paquete horneado (python -m core.bake): imágenes ya escaladas listas para mmap.
+USE_BAKED_ASSETS = True
+BAKED_ASSETS_PATH = "assets/baked/sprites.bin"
+BAKED_ENTRIES = [
+    ("assets/player.png", (64, 64)),
+    ("assets/enemy_ground.png", (56, 56)),
+    ("assets/enemy_flying.png", (56, 56)),
+    ("assets/final_boss.png", (260, 260)),
+    ("assets/power_double.png", (36, 36)),
+    ("assets/heal.png", (36, 36)),
+    ("assets/fast.png", (36, 36)),
+    ("assets/power_shield.png", (36, 36)),
+    ("assets/rafaga.png", (36, 36)),
+    ("assets/background11.png", (WIDTH, HEIGHT)),
+]
 
 def load_power(name):
     """Carga una imagen de powerup o devuelve un fallback visible."""
@@ -198,16 +493,60 @@ def load_power(name):
     pygame.draw.circle(s, (255, 255, 255, 40), (12, 12), 6)
     return s
 
-POWER_DOUBLE_IMG = load_power("power_double")
-POWER_HEAL_IMG   = load_power("heal")
-POWER_FAST_IMG   = load_power("fast")
-POWER_SHIELD_IMG = load_power("power_shield")
-POWER_RAFAGA_IMG = load_power("rafaga")
+# Imágenes que no hacen falta al arrancar: se precargan en segundo plano antes del nivel que las usa.
+preloader = AssetPreloader(assets)
+BOSS_IMG_PATH = "assets/final_boss.png"
+BOSS_IMG_SIZE = (260, 260)
+
+def level_assets(level):
+    """Imágenes que necesita `level` además de las cargadas al inicio."""
+    if level % 5 == 0:
+        return [(BOSS_IMG_PATH, BOSS_IMG_SIZE)]
+    return []
+
+def boss_image():
+    """Sprite del jefe (ya precargado normalmente) o un fallback visible."""
+    if os.path.exists(BOSS_IMG_PATH):
+        return preloader.get(BOSS_IMG_PATH, BOSS_IMG_SIZE)
+    img = pygame.Surface(BOSS_IMG_SIZE, pygame.SRCALPHA)
+    img.fill((180, 50, 180))
+    return img
+
+def load_assets():
+    """Carga las imágenes de los sprites (necesita la ventana creada para convert_alpha)."""
+    global PLAYER_IMG, ENEMY_GROUND_IMG, ENEMY_FLY_IMG
+    global POWER_DOUBLE_IMG, POWER_HEAL_IMG, POWER_FAST_IMG, POWER_SHIELD_IMG, POWER_RAFAGA_IMG
+    if USE_BAKED_ASSETS and assets.pack is None:
+        try:
+            assets.use_pack(ensure_baked(BAKED_ENTRIES, BAKED_ASSETS_PATH))
+        except OSError as e:
+            print(f"[ADVERTENCIA] Sin paquete horneado ({e}); se cargan los PNG")
+    PLAYER_IMG = load_image("assets/player.png", (64, 64))
+    if PLAYER_IMG is None:
+        PLAYER_IMG = pygame.Surface((64, 64), pygame.SRCALPHA)
+        PLAYER_IMG.fill((100, 180, 255))  # fallback visible
+
+    ENEMY_GROUND_IMG = load_image("assets/enemy_ground.png", (56, 56))
+    if ENEMY_GROUND_IMG is None:
+        ENEMY_GROUND_IMG = pygame.Surface((56, 56), pygame.SRCALPHA)
+        ENEMY_GROUND_IMG.fill((200, 80, 80))  # fallback visible para depuración
+
+    ENEMY_FLY_IMG = load_image("assets/enemy_flying.png", (56, 56))
+    if ENEMY_FLY_IMG is None:
+        ENEMY_FLY_IMG = pygame.Surface((56, 56), pygame.SRCALPHA)
+        ENEMY_FLY_IMG.fill((200, 160, 60))  # fallback visible para depuración
+
+    POWER_DOUBLE_IMG = load_power("power_double")
+    POWER_HEAL_IMG   = load_power("heal")
+    POWER_FAST_IMG   = load_power("fast")
+    POWER_SHIELD_IMG = load_power("power_shield")
+    POWER_RAFAGA_IMG = load_power("rafaga")
+
+    # Opcional: imprimir si faltan archivos para diagnosticar
+    for p in ("assets/enemy_ground.png","assets/enemy_flying.png","assets/player.png"):
+        if not os.path.exists(p):
+            print(f"[ADVERTENCIA] No encontrado: {p}")
 
-# Opcional: imprimir si faltan archivos para diagnosticar
-for p in ("assets/enemy_ground.png","assets/enemy_flying.png","assets/player.png"):
-    if not os.path.exists(p):
-        print(f"[ADVERTENCIA] No encontrado: {p}")
 # ------------------------- PARÁMETROS -------------------------
 NUM_LEVELS = 10
 BASE_ENEMIES = 6
@@ -218,15 +557,37 @@ ENEMY_SHOOT_BASE = 0.006
 ENEMY_SHOOT_INC = 0.004
 WAVE_PAUSE_BASE_MS = 2500
 WAVE_PAUSE_PER_LEVEL_MS = 500
+# Proyectiles: "sprites" (pool de Bullet/EnemyBullet) o "arrays" (motor NumPy, para bullet-hell)
+PROJECTILE_BACKEND = "sprites"
+# Colisiones: "rect" (cajas) o "mask" (píxel a píxel: rect primero y máscara cacheada solo si hay
+# choque). El modo "mask" se aplica a los proyectiles "sprites"; el motor de arrays usa siempre rects.
+COLLISION_MODE = "rect"
 
 # ------------------------- CLASES JUEGO -------------------------
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, vx, vy, color=(255,0,255), damage=1):
+# Imágenes de bala compartidas por color y tamaño (se crean una sola vez)
+_BULLET_IMAGES = {}
+
+def bullet_image(size, color, alpha=True):
+    key = (size, color, alpha)
+    img = _BULLET_IMAGES.get(key)
+    if img is None:
+        img = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+        img.fill(color)
+        _BULLET_IMAGES[key] = img
+    return img
+
+class Bullet(PooledSprite):
+    def __init__(self):
         super().__init__()
-        surf = pygame.Surface((8,18), pygame.SRCALPHA)
-        surf.fill(color)
-        self.image = surf
-        self.rect = self.image.get_rect(center=(x,y))
+        self.rect = pygame.Rect(0, 0, 8, 18)
+        self.image = None
+        self.vx = 0
+        self.vy = 0
+        self.damage = 1
+
+    def activate(self, x, y, vx, vy, color=(255,0,255), damage=1):
+        self.image = bullet_image((8,18), color)
+        self.rect.center = (x, y)
         self.vx = vx
         self.vy = vy
         self.damage = damage
@@ -238,13 +599,16 @@ class Bullet(pygame.sprite.Sprite):
             self.rect.right < 0 or self.rect.left > WIDTH):
             self.kill()
 
-class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, speed):
+class EnemyBullet(PooledSprite):
+    def __init__(self):
         super().__init__()  # Constructor padre.
-        surf = pygame.Surface((8,14))  # Superficie para la bala (roja).
-        surf.fill((255,80,80))
-        self.image = surf
-        self.rect = self.image.get_rect(center=(x,y))
+        self.rect = pygame.Rect(0, 0, 8, 14)
+        self.image = bullet_image((8,14), (255,80,80), alpha=False)  # Bala roja compartida.
+        self.speedy = 0
+        self.vx = 0
+
+    def activate(self, x, y, speed):
+        self.rect.center = (x, y)
         self.speedy = speed  # Velocidad Y inicial (para compatibilidad con enemigos normales).
         self.vx = 0  # NUEVO: Velocidad X inicial (0 por default, para balas verticales).
 
@@ -255,6 +619,10 @@ class EnemyBullet(pygame.sprite.Sprite):
         if self.rect.top > HEIGHT or self.rect.bottom < 0 or self.rect.right < 0 or self.rect.left > WIDTH:
             self.kill()
 
+# Pools pre-asignados: en régimen estable disparar no crea Surfaces ni sprites nuevos.
+Bullet.pool = SpritePool(Bullet, prealloc=64)
+EnemyBullet.pool = SpritePool(EnemyBullet, prealloc=128)
+
 class PowerUp(pygame.sprite.Sprite):
     def __init__(self, x, y, ptype):
         super().__init__()
@@ -269,8 +637,9 @@ class PowerUp(pygame.sprite.Sprite):
             self.kill()
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, start_x=WIDTH//2, target_y=HEIGHT-80, initial_entry=True):
+    def __init__(self, session, start_x=WIDTH//2, target_y=HEIGHT-80, initial_entry=True):
         super().__init__()
+        self.session = session
         self.image = PLAYER_IMG
         self.rect = self.image.get_rect(center=(start_x, -120 if initial_entry else target_y))
         self.target_y = target_y
@@ -306,15 +675,15 @@ class Player(pygame.sprite.Sprite):
                 self.is_entering = False
             return
 
-        keys = pygame.key.get_pressed()
+        controls = self.session.controls
         speed = 6
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if controls.left:
             self.rect.x -= speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if controls.right:
             self.rect.x += speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if controls.up:
             self.rect.y -= speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if controls.down:
             self.rect.y += speed
 
         if self.rect.left < 0: self.rect.left = 0
@@ -322,7 +691,7 @@ class Player(pygame.sprite.Sprite):
         if self.rect.top < 0: self.rect.top = 0
         if self.rect.bottom > HEIGHT: self.rect.bottom = HEIGHT
 
-        now = pygame.time.get_ticks()
+        now = self.session.clock.now()
         if self.double_shot and now - self.double_timer > 10000:
             self.double_shot = False
         if self.fast_timer and now - self.fast_timer > 10000:
@@ -342,28 +711,25 @@ class Player(pygame.sprite.Sprite):
         if len(self.trail) > self.trail_length:
             self.trail.pop(0)
 
-    def draw_trail(self, surface):
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = int(200 * (i / max(1, self.trail_length - 1)))
-            color = (100, 200, 255, alpha)
-            trail_surface = pygame.Surface((10, 24), pygame.SRCALPHA)
-            pygame.draw.ellipse(trail_surface, color, (0, 0, 10, 24))
-            surface.blit(trail_surface, (tx - 5, ty - 12))
+    def draw_trail(self, surface, max_points=None):
+        # Una elipse pre-renderizada por punto de la estela (alfa creciente hacia el jugador)
+        sprites = effects.fade((10, 24), (100, 200, 255), self.trail_length, max_alpha=200)
+        # `max_points` (calidad) deja solo los puntos más recientes, con el alfa que ya tenían
+        first = 0 if max_points is None else max(0, len(self.trail) - max_points)
+        return surface.blits([(sprites[i], (self.trail[i][0] - 5, self.trail[i][1] - 12))
+                              for i in range(first, len(self.trail))])
 
     def shoot(self):
-        now = pygame.time.get_ticks()
+        now = self.session.clock.now()
         if now - self.last_shot < self.shoot_delay:
             return
         self.last_shot = now
         if self.double_shot:
-            b1 = Bullet(self.rect.centerx - 18, self.rect.top, 0, self.bullet_speed, (255,0,255), damage=self.damage)
-            b2 = Bullet(self.rect.centerx + 18, self.rect.top, 0, self.bullet_speed, (255,0,255), damage=self.damage)
-            all_sprites.add(b1, b2); bullets.add(b1, b2)
+            self.session.fire_bullet(self.rect.centerx - 18, self.rect.top, 0, self.bullet_speed, (255,0,255), damage=self.damage)
+            self.session.fire_bullet(self.rect.centerx + 18, self.rect.top, 0, self.bullet_speed, (255,0,255), damage=self.damage)
         else:
-            b = Bullet(self.rect.centerx, self.rect.top, 0, self.bullet_speed, (255,0,255), damage=self.damage)
-            all_sprites.add(b); bullets.add(b)
-        if snd_shoot:
-            snd_shoot.play()
+            self.session.fire_bullet(self.rect.centerx, self.rect.top, 0, self.bullet_speed, (255,0,255), damage=self.damage)
+        sounds.play("shoot")
 
     def fire_rafaga_front(self):
         origin_x = self.rect.centerx
@@ -375,12 +741,11 @@ class Player(pygame.sprite.Sprite):
             rad = math.radians(a)
             vx = speed * math.sin(rad)
             vy = -speed * math.cos(rad)
-            b = Bullet(origin_x, origin_y, vx, vy, color, damage=self.damage)
-            all_sprites.add(b); bullets.add(b)
-        # no sonido de ráfaga separado; si quieres, reutiliza snd_shoot o crea uno nuevo
+            self.session.fire_bullet(origin_x, origin_y, vx, vy, color, damage=self.damage)
+        # no sonido de ráfaga separado; si quieres, usa sounds.play("shoot") o registra uno nuevo
 
     def apply_powerup(self, ptype):
-        now = pygame.time.get_ticks()
+        now = self.session.clock.now()
         if ptype == "double":
             self.double_shot = True; self.double_timer = now
         elif ptype == "heal":
@@ -394,8 +759,7 @@ class Player(pygame.sprite.Sprite):
             self.rafaga_active = True
         self.rafaga_timer = now
         self.rafaga_last_shot = 0
-    if snd_powerup:
-        snd_powerup.play()
+        sounds.play("powerup")
 
 
     def reset_entry(self):
@@ -404,11 +768,11 @@ class Player(pygame.sprite.Sprite):
         self.trail.clear()
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, flying, level):
+    def __init__(self, x, y, flying, level, rng):
         super().__init__()
         self.image = ENEMY_FLY_IMG if flying else ENEMY_GROUND_IMG
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.speedx = random.choice([-1, 1]) * (1 + level * 0.3)
+        self.speedx = rng.choice([-1, 1]) * (1 + level * 0.3)
         self.hp = 1 + (1 if flying else 0) + (level//3)
     
     def update(self):
@@ -422,203 +786,523 @@ class Enemy(pygame.sprite.Sprite):
             self.kill()
 
 class Boss(pygame.sprite.Sprite):
-    def __init__(self, level):
+    def __init__(self, session, level):
         super().__init__()
-        self.image = BOSS_IMG
+        self.session = session
+        self.image = boss_image()
         self.rect = self.image.get_rect(center=(WIDTH//2, 140))
         self.hp = 80 + level * 40
         self.level = level
         self.move_dir = 1
         self.speedx = 2 + level//2
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = session.clock.now()
     def update(self):
         self.rect.x += self.speedx * self.move_dir
         if self.rect.left <= 0 or self.rect.right >= WIDTH:
             self.move_dir *= -1
-        now = pygame.time.get_ticks()
+        now = self.session.clock.now()
         interval = max(1200 - (self.level-1)*100, 400)
         if now - self.last_shot > interval:
             spread = 1 + (self.level-1)
             offsets = [i*25 for i in range(-spread, spread+1)]
-            for off in offsets:
-                eb = EnemyBullet(self.rect.centerx + off, self.rect.bottom, 6 + self.level//2)
-                all_sprites.add(eb); enemy_bullets.add(eb)
-            if snd_final_boss_shoot:
-                snd_final_boss_shoot.play()
+            self.session.fire_enemy_bullets([self.rect.centerx + off for off in offsets], self.rect.bottom, 6 + self.level//2)
+            sounds.play("final_boss_shoot")
             self.last_shot = now
 
 # ------------------------- AUX y BUCLE -------------------------
 def difficulty(level):
     return ENEMY_SPEED_BASE + ENEMY_SPEED_INC * (level-1), ENEMY_SHOOT_BASE + ENEMY_SHOOT_INC * (level-1), PLAYER_BASE_DAMAGE + (level-1)//2
 
-def spawn_wave(level, qty):
-    margin_x = 80
-    spacing = max(80, (WIDTH - 2*margin_x) // qty)
-    y_base = 60
-    for i in range(qty):
-        x = margin_x + i * spacing
-        flying = (i % 3 == 0 and random.random() < 0.6)
-        e = Enemy(x, y_base + (i % 3) * 68, flying, level)
-        all_sprites.add(e); enemies.add(e)
-
-def maybe_drop_powerup(enemy):
-    if random.random() < 0.25:
-        ptype = random.choice(["double","heal","fast","shield","rafaga"])
-        pu = PowerUp(enemy.rect.centerx, enemy.rect.centery, ptype)
-        all_sprites.add(pu); powerups.add(pu)
-
-all_sprites = pygame.sprite.Group()
-bullets = pygame.sprite.Group()
-enemy_bullets = pygame.sprite.Group()
-enemies = pygame.sprite.Group()
-powerups = pygame.sprite.Group()
-boss_group = pygame.sprite.Group()
-
-player = Player(initial_entry=True)
-all_sprites.add(player)
-starfield = SimpleStarfield(WIDTH, HEIGHT, num_stars=120, num_planets=2)
-
-current_level = 1
-game_won = False
-font_default = pygame.font.SysFont(None, 28)
-font_big = pygame.font.SysFont(None, 84)
-
-while current_level <= NUM_LEVELS:
-    scroll_x = 0.0
-    scroll_y = 0.0
-    all_sprites.empty(); bullets.empty(); enemy_bullets.empty(); enemies.empty(); powerups.empty(); boss_group.empty()
-    all_sprites.add(player)
-    starfield.set_level(current_level, NUM_LEVELS)
-    enemy_speed_val, enemy_shoot_chance, player_damage_value = difficulty(current_level)
-    player.damage = player_damage_value
-    total_waves = current_level
-    completed_waves = 0
-    enemies_qty_base = BASE_ENEMIES + (current_level - 1) * 2
-    spawn_wave(current_level, enemies_qty_base)
-    boss_spawned = False
-    level_running = True
-    waiting_for_next_wave = False
-    next_wave_start_time = 0
-    wave_pause_ms = WAVE_PAUSE_BASE_MS + (current_level-1)*WAVE_PAUSE_PER_LEVEL_MS
-
-    while level_running:
-        CLOCK.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                if not player.is_entering:
-                    player.shoot()
-
-        vertical_speed = min(0.8 + current_level * 0.08, 4.0)
-        starfield.scroll_speed = vertical_speed * 0.9
-        starfield.update(vertical_speed)
-        starfield.draw(WIN)
-
-        all_sprites.update()
-        bullets.update()
-        enemy_bullets.update()
-        powerups.update()
-        boss_group.update()
-
-        for e in list(enemies):
-            if random.random() < (enemy_shoot_chance * 0.5):
-                eb = EnemyBullet(e.rect.centerx, e.rect.bottom, 5 + current_level//3)
-                all_sprites.add(eb); enemy_bullets.add(eb)
-                if snd_enemy_shoot:
-                    snd_enemy_shoot.play()
-
-        hits = pygame.sprite.groupcollide(enemies, bullets, False, True)
-        for enemy, blist in hits.items():
-            total_dmg = sum(b.damage for b in blist)
+class Controls:
+    """Entrada de un tick: direcciones mantenidas y si se pidió disparar."""
+    __slots__ = ("left", "right", "up", "down", "fire")
+
+    def __init__(self, left=False, right=False, up=False, down=False, fire=False):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.fire = fire
+
+    @classmethod
+    def from_keys(cls, keys, fire=False):
+        """Construye la entrada a partir de pygame.key.get_pressed()."""
+        return cls(keys[pygame.K_LEFT] or keys[pygame.K_a],
+                   keys[pygame.K_RIGHT] or keys[pygame.K_d],
+                   keys[pygame.K_UP] or keys[pygame.K_w],
+                   keys[pygame.K_DOWN] or keys[pygame.K_s],
+                   fire)
+
+    def bits(self):
+        """La entrada empaquetada en un entero (para las grabaciones)."""
+        return (self.left | self.right << 1 | self.up << 2 | self.down << 3 | self.fire << 4)
+
+    @classmethod
+    def from_bits(cls, bits):
+        return cls(bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8), bool(bits & 16))
+
+
+class GameSession:
+    """Una partida completa que avanza tick a tick con step(controls).
+
+    No lee el teclado ni el reloj real: la entrada llega como Controls y el
+    tiempo es un SimClock, así que con la misma semilla y las mismas
+    entradas el resultado es idéntico. Con `headless=True` no se simula el
+    fondo (solo es cosmético) y la partida puede correr más rápido que el
+    tiempo real sin ventana.
+    """
+    def __init__(self, seed=None, headless=False):
+        self.seed = seed
+        self.headless = headless
+        # RNG propio de la partida: otra sesión en el mismo proceso no altera su secuencia
+        self.rng = random.Random(seed)
+        self.clock = SimClock(FPS)
+        self.controls = Controls()
+
+        # Cada sprite se registra una sola vez en la escena; los grupos por tipo son para colisiones.
+        self.scene = Scene()
+        self.enemies = self.scene.group("enemies", layer=0)
+        self.boss_group = self.scene.group("boss", layer=0)
+        self.scene.group("player", layer=1)
+        self.powerups = self.scene.group("powerups", layer=2)
+        self.enemy_bullets = self.scene.group("enemy_bullets", layer=3)
+        self.bullets = self.scene.group("bullets", layer=3)
+        # Rejilla de colisiones de las balas del jugador (se reconstruye una vez por tick)
+        self.bullet_grid = SpatialHash(cell_size=64)
+        # Próximo disparo de cada enemigo (un heap, no un dado por enemigo y tick)
+        self.enemy_fire = FireScheduler(seed=self.rng.getrandbits(32))
+
+        self.collided = collide_mask if COLLISION_MODE == "mask" else None
+        self.projectile_engine = None
+        if PROJECTILE_BACKEND == "arrays":
+            if np is None:
+                print("[ADVERTENCIA] NumPy no está instalado; se usan proyectiles como sprites.")
+            else:
+                self.projectile_engine = ProjectileEngine(WIDTH, HEIGHT)
+
+        self.player = Player(self, initial_entry=True)
+        self.starfield = None if headless else SimpleStarfield(WIDTH, HEIGHT, num_stars=120, num_planets=2, seed=seed)
+        self.hud = None
+        self.trail_points = None  # puntos de estela a dibujar (None = todos); lo fija apply_quality
+
+        self.current_level = 1
+        self.game_won = False
+        self.over = False
+        self.level_ticks = []  # ticks que costó superar cada nivel
+        self.start_level()
+
+    # ---------------- niveles y oleadas ----------------
+    def start_level(self):
+        self.level_start_tick = self.clock.ticks
+        self.scene.empty()
+        if self.projectile_engine is not None:
+            self.projectile_engine.clear()
+        self.scene.add("player", self.player)
+        if self.starfield:
+            self.starfield.set_level(self.current_level, NUM_LEVELS)
+        enemy_speed_val, enemy_shoot_chance, player_damage_value = difficulty(self.current_level)
+        self.enemy_fire.clear()
+        self.enemy_fire.set_chance(enemy_shoot_chance * 0.5)
+        self.player.damage = player_damage_value
+        self.total_waves = self.current_level
+        self.completed_waves = 0
+        self.enemies_qty_base = BASE_ENEMIES + (self.current_level - 1) * 2
+        self.spawn_wave(self.current_level, self.enemies_qty_base)
+        self.boss_spawned = False
+        self.waiting_for_next_wave = False
+        self.next_wave_start_time = 0
+        self.wave_pause_ms = WAVE_PAUSE_BASE_MS + (self.current_level-1)*WAVE_PAUSE_PER_LEVEL_MS
+        self.vertical_speed = min(0.8 + self.current_level * 0.08, 4.0)
+        # Lo que usará este nivel y el siguiente se carga en segundo plano mientras se juega
+        preloader.poll()
+        preloader.request(level_assets(self.current_level) + level_assets(self.current_level + 1))
+
+    def end_level(self):
+        """Pasa al siguiente nivel o termina la partida."""
+        if self.player.hp > 0:
+            self.level_ticks.append(self.clock.ticks - self.level_start_tick)
+        if self.player.hp > 0 and not self.game_won and self.current_level < NUM_LEVELS:
+            self.current_level += 1
+            self.start_level()
+        else:
+            self.over = True
+
+    def spawn_wave(self, level, qty):
+        margin_x = 80
+        spacing = max(80, (WIDTH - 2*margin_x) // qty)
+        y_base = 60
+        for i in range(qty):
+            x = margin_x + i * spacing
+            flying = (i % 3 == 0 and self.rng.random() < 0.6)
+            e = Enemy(x, y_base + (i % 3) * 68, flying, level, self.rng)
+            self.scene.add("enemies", e)
+            self.enemy_fire.add(e)
+
+    def maybe_drop_powerup(self, enemy):
+        if self.rng.random() < 0.25:
+            ptype = self.rng.choice(["double","heal","fast","shield","rafaga"])
+            pu = PowerUp(enemy.rect.centerx, enemy.rect.centery, ptype)
+            self.scene.add("powerups", pu)
+
+    # ---------------- disparos y colisiones ----------------
+    def fire_bullet(self, x, y, vx, vy, color=(255,0,255), damage=1):
+        """Dispara una bala del jugador centrada en (x, y)."""
+        if self.projectile_engine is not None:
+            self.projectile_engine.spawn(x, y, vx, vy, (8,18), color, damage, OWNER_PLAYER)
+        else:
+            self.scene.add("bullets", Bullet.spawn(x, y, vx, vy, color, damage=damage))
+
+    def fire_enemy_bullets(self, xs, y, speed):
+        """Dispara balas enemigas verticales desde cada x de `xs` (un enemigo o el abanico del jefe)."""
+        if self.projectile_engine is not None:
+            n = len(xs)
+            self.projectile_engine.spawn_many(xs, [y]*n, [0]*n, [speed]*n, (8,14), (255,80,80),
+                                              owner=OWNER_ENEMY, alpha=False)
+        else:
+            self.scene.add("enemy_bullets", *[EnemyBullet.spawn(x, y, speed) for x in xs])
+
+    def update_projectiles(self):
+        """Avanza el motor de arrays o, con sprites, indexa las balas para las colisiones."""
+        if self.projectile_engine is not None:
+            self.projectile_engine.step()
+        else:
+            self.bullet_grid.rebuild(self.bullets)
+
+    def bullet_hits(self, group):
+        """Daño de las balas del jugador sobre `group`: {sprite: daño total}. Las balas que tocan se eliminan."""
+        if self.projectile_engine is not None:
+            targets = group.sprites()
+            damage = self.projectile_engine.collide([s.rect for s in targets], OWNER_PLAYER)
+            return {s: d for s, d in zip(targets, damage.tolist()) if d}
+        hits = self.bullet_grid.groupcollide(group, False, True, self.collided)
+        return {s: sum(b.damage for b in blist) for s, blist in hits.items()}
+
+    def player_hit(self):
+        """True si alguna bala enemiga toca al jugador (las balas que tocan se eliminan)."""
+        if self.projectile_engine is not None:
+            return self.projectile_engine.collide([self.player.rect], OWNER_ENEMY)[0] > 0
+        return bool(pygame.sprite.spritecollide(self.player, self.enemy_bullets, True, self.collided))
+
+    # ---------------- simulación ----------------
+    def step(self, controls):
+        """Avanza un tick de simulación con la entrada `controls`."""
+        if self.over:
+            return
+        player = self.player
+        self.controls = controls
+        self.clock.advance()
+        sounds.tick(self.clock.now())
+        self.scene.snapshot()
+        if controls.fire and not player.is_entering:
+            player.shoot()
+
+        if self.starfield:
+            with profiler.scope("sim.starfield"):
+                self.starfield.scroll_speed = self.vertical_speed * 0.9
+                self.starfield.update(self.vertical_speed)
+        with profiler.scope("sim.update"):
+            self.scene.update()
+            self.update_projectiles()
+
+        shooters = self.enemy_fire.due(self.enemies)
+        for e in shooters:
+            self.fire_enemy_bullets([e.rect.centerx], e.rect.bottom, 5 + self.current_level//3)
+            sounds.play("enemy_shoot")  # varios en el mismo tick se fusionan en uno
+
+        with profiler.scope("sim.collision"):
+            hits = self.bullet_hits(self.enemies)
+        for enemy, total_dmg in hits.items():
             enemy.hp -= total_dmg
             if enemy.hp <= 0:
                 enemy.kill()
-                player.score += 10 * current_level
-                maybe_drop_powerup(enemy)
-
-        if not enemies and not boss_spawned and not waiting_for_next_wave:
-            completed_waves += 1
-            if completed_waves < total_waves:
-                waiting_for_next_wave = True
-                next_wave_start_time = pygame.time.get_ticks() + wave_pause_ms
+                player.score += 10 * self.current_level
+                self.maybe_drop_powerup(enemy)
+
+        level_running = True
+        if not self.enemies and not self.boss_spawned and not self.waiting_for_next_wave:
+            self.completed_waves += 1
+            if self.completed_waves < self.total_waves:
+                self.waiting_for_next_wave = True
+                self.next_wave_start_time = self.clock.now() + self.wave_pause_ms
             else:
-                if current_level % 5 == 0:
-                    boss = Boss(current_level)
-                    all_sprites.add(boss); boss_group.add(boss)
-                    boss_spawned = True
+                if self.current_level % 5 == 0:
+                    boss = Boss(self, self.current_level)
+                    self.scene.add("boss", boss)
+                    self.boss_spawned = True
                 else:
                     level_running = False
 
-        if waiting_for_next_wave:
-            now = pygame.time.get_ticks()
-            remain = max(0, next_wave_start_time - now)
-            secs = ceil(remain / 1000)
-            txt_w = font_default.render(f"Siguiente oleada en: {secs}s", True, WHITE)
-            WIN.blit(txt_w, (WIDTH//2 - txt_w.get_width()//2, HEIGHT//2 - 40))
-            if now >= next_wave_start_time:
-                spawn_wave(current_level, enemies_qty_base + completed_waves)
-                waiting_for_next_wave = False
-
-        if boss_spawned and boss_group:
-            hitsb = pygame.sprite.groupcollide(boss_group, bullets, False, True)
-            for bobj, bls in hitsb.items():
-                bobj.hp -= sum(b.damage for b in bls)
+        if self.waiting_for_next_wave and preloader.busy():
+            preloader.poll()  # entrega (convert_alpha) de lo precargado durante la pausa
+        if self.waiting_for_next_wave and self.clock.now() >= self.next_wave_start_time:
+            self.spawn_wave(self.current_level, self.enemies_qty_base + self.completed_waves)
+            self.waiting_for_next_wave = False
+
+        if self.boss_spawned and self.boss_group:
+            with profiler.scope("sim.collision"):
+                hitsb = self.bullet_hits(self.boss_group)
+            for bobj, dmg in hitsb.items():
+                bobj.hp -= dmg
                 if bobj.hp <= 0:
                     bobj.kill()
                     player.score += 500
-                    boss_spawned = False
-                    if current_level == NUM_LEVELS:
-                        game_won = True
-                        level_running = False
-                        current_level = NUM_LEVELS + 1
-                    else:
-                        level_running = False
+                    self.boss_spawned = False
+                    if self.current_level == NUM_LEVELS:
+                        self.game_won = True
+                    level_running = False
 
         if not player.shield:
-            if pygame.sprite.spritecollide(player, enemy_bullets, True):
+            with profiler.scope("sim.collision"):
+                hit = self.player_hit()
+            if hit:
                 player.hp -= 1
                 if player.hp <= 0:
                     level_running = False
-                    current_level = NUM_LEVELS + 1
 
-        pups = pygame.sprite.spritecollide(player, powerups, True)
+        with profiler.scope("sim.collision"):
+            pups = pygame.sprite.spritecollide(player, self.powerups, True)
         for pu in pups:
             player.apply_powerup(pu.type)
 
-        player.draw_trail(WIN)
+        if not level_running:
+            self.end_level()
+
+    def result(self):
+        """Resumen de la partida (para simulaciones y pruebas de regresión)."""
+        return {
+            "seed": self.seed,
+            "won": self.game_won,
+            "level": self.current_level,
+            "waves": self.completed_waves,
+            "hp": self.player.hp,
+            "score": self.player.score,
+            "ticks": self.clock.ticks,
+            "level_ticks": list(self.level_ticks),
+        }
+
+    # ---------------- dibujo ----------------
+    def _init_hud(self):
+        font_default = pygame.font.SysFont(None, 28)
+        # HUD cacheado: cada línea solo se vuelve a renderizar cuando cambia su valor
+        self.hud = {
+            "level": CachedText(font_default, WHITE),
+            "hp": CachedText(font_default, WHITE),
+            "score": CachedText(font_default, WHITE),
+            "waves": CachedText(font_default, WHITE),
+            "wave_timer": CachedText(font_default, WHITE),
+            "rafaga": CachedText(font_default, (100,200,255)),
+        }
+        self.dirty_background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.dirty_background_color = None
+
+    def apply_quality(self, tier):
+        """Aplica un QualityTier a lo que solo se dibuja (fondo y estela)."""
+        self.trail_points = tier.trail
+        if self.starfield:
+            self.starfield.apply_quality(tier)
+        if self.hud is not None:
+            self.dirty_background_color = None  # repinta el fondo fijo del modo dirty
+
+    def draw(self, surface, alpha=1.0, dirty=None):
+        """Dibuja el estado actual interpolado `alpha` hacia el tick anterior."""
+        if self.hud is None:
+            self._init_hud()
+        if dirty is None:
+            dirty = DirtyRects()
+        starfield = self.starfield
+        with profiler.scope("draw.background"):
+            if dirty.enabled:
+                # Modo dirty: el fondo queda fijo y solo se repinta cuando cambia el color del nivel.
+                if self.dirty_background_color != starfield.current_color:
+                    starfield.draw(self.dirty_background)
+                    self.dirty_background_color = starfield.current_color
+                    dirty.set_background(self.dirty_background)
+                dirty.begin(surface)
+            else:
+                starfield.draw(surface)
+
+        with profiler.scope("draw.sprites"):
+            self._draw_sprites(surface, alpha, dirty)
+        with profiler.scope("draw.hud"):
+            self._draw_hud(surface, dirty)
 
-        all_sprites.draw(WIN)
-        bullets.draw(WIN)
-        enemy_bullets.draw(WIN)
-        powerups.draw(WIN)
-        boss_group.draw(WIN)
+    def _draw_sprites(self, surface, alpha, dirty):
+        player = self.player
+        dirty.add_list(player.draw_trail(surface, self.trail_points))
 
-        WIN.blit(font_default.render(f"Nivel: {current_level}/{NUM_LEVELS}", True, WHITE), (12,12))
-        WIN.blit(font_default.render(f"Vidas: {player.hp}", True, WHITE), (12,40))
-        WIN.blit(font_default.render(f"Puntaje: {player.score}", True, WHITE), (12,68))
-        WIN.blit(font_default.render(f"Oleadas: {completed_waves}/{total_waves}", True, WHITE), (12,96))
+        dirty.add_list(self.scene.draw(surface, alpha))
+        if self.projectile_engine is not None:
+            dirty.add_list(self.projectile_engine.draw(surface, alpha))
 
         if player.shield:
-            s = pygame.Surface((player.rect.width+30, player.rect.height+30), pygame.SRCALPHA)
-            pygame.draw.ellipse(s, (50,180,255,100), s.get_rect())
-            WIN.blit(s, (player.rect.x-15, player.rect.y-15))
-
-        if player.rafaga_active:
-            WIN.blit(font_default.render(" RÁFAGA ACTIVA ", True, (100,200,255)), (WIDTH//2 - 90, 20))
+            px, py = self.scene.render_pos(player, alpha)
+            s = effects.ellipse((player.rect.width+30, player.rect.height+30), (50,180,255,100))
+            dirty.add(surface.blit(s, (px-15, py-15)))
+
+    def _draw_hud(self, surface, dirty):
+        hud = self.hud
+        player = self.player
+        if self.waiting_for_next_wave:
+            remain = max(0, self.next_wave_start_time - self.clock.now())
+            secs = ceil(remain / 1000)
+            txt_w = hud["wave_timer"].render(f"Siguiente oleada en: {secs}s")
+            dirty.add(surface.blit(txt_w, (WIDTH//2 - txt_w.get_width()//2, HEIGHT//2 - 40)))
 
-        pygame.display.flip()
+        dirty.add(hud["level"].draw(surface, f"Nivel: {self.current_level}/{NUM_LEVELS}", (12,12)))
+        dirty.add(hud["hp"].draw(surface, f"Vidas: {player.hp}", (12,40)))
+        dirty.add(hud["score"].draw(surface, f"Puntaje: {player.score}", (12,68)))
+        dirty.add(hud["waves"].draw(surface, f"Oleadas: {self.completed_waves}/{self.total_waves}", (12,96)))
 
-    if player.hp > 0 and not game_won:
-        current_level += 1
+        if player.rafaga_active:
+            dirty.add(hud["rafaga"].draw(surface, " RÁFAGA ACTIVA ", (WIDTH//2 - 90, 20)))
+
+
+def run_headless(seed=None, max_ticks=FPS * 60 * 30, bot=None):
+    """Juega una partida sin ventana ni audio, tan rápido como se pueda.
+
+    `bot(session)` devuelve los Controls de cada tick (por defecto no hace
+    nada). Devuelve GameSession.result().
+    """
+    if WIN is None:
+        init_display(headless=True)
+        load_assets()
+    session = GameSession(seed=seed, headless=True)
+    idle = Controls()
+    while not session.over and session.clock.ticks < max_ticks:
+        session.step(bot(session) if bot else idle)
+    return session.result()
+
+
+def export_profile():
+    """Guarda lo medido por el profiler en esta sesión (CSV + JSON) si hay algo que guardar."""
+    if not PROFILE_EXPORT_DIR or not profiler.rows:
+        return
+    os.makedirs(PROFILE_EXPORT_DIR, exist_ok=True)
+    stem = os.path.join(PROFILE_EXPORT_DIR, time.strftime("perf_%Y%m%d_%H%M%S"))
+    profiler.export(stem + ".csv")
+    profiler.export(stem + ".json")
+    print(f"[PERF] Perfil guardado en {stem}.csv/.json")
+
+
+def load_replay(path):
+    """Carga una grabación; falla si se grabó con otro ritmo de simulación (divergiría)."""
+    replay = Replay.load(path)
+    if replay.tick_rate != FPS:
+        raise ValueError(f"{path}: grabación a {replay.tick_rate} ticks/s, pero el juego simula a {FPS} (FPS)")
+    return replay
+
+
+def run_replay(path, render=False):
+    """Reproduce una grabación sin ventana; con `render` también dibuja cada tick (prueba de carga).
+
+    Devuelve GameSession.result(), que debe coincidir con el de la partida grabada.
+    """
+    replay = load_replay(path)
+    if WIN is None:
+        init_display(headless=True)
+        load_assets()
+    session = GameSession(seed=replay.seed, headless=not render)
+    for bits in replay:
+        if session.over:
+            break
+        session.step(Controls.from_bits(bits))
+        if render:
+            session.draw(WIN)
+    return session.result()
+
+
+def main(record=None, replay=None):
+    """Bucle del juego. `record`: archivo donde grabar la entrada; `replay`: grabación a reproducir."""
+    init_display()
+    init_sound()
+    load_assets()
+    clock = pygame.time.Clock()
+    fps_cap = render_fps()
+    timestep = FixedTimestep(FPS, max_steps=5)
+    # Los lienzos del backend GPU y de resolución interna se presentan ellos mismos y siempre
+    # enteros (la ventana no conserva el frame anterior o va escalada): sin rects sucios.
+    present = getattr(WIN, "present", None)
+    dirty = DirtyRects(enabled=RENDER_MODE == "dirty" and present is None, flip=present)
+    playback = None
+    if replay:
+        rec = load_replay(replay)
+        seed = rec.seed
+        playback = iter(rec)
     else:
-        break
-
-WIN.fill(BLACK)
-font_big = pygame.font.SysFont(None, 72)
-msg = font_big.render("🎉 ¡Juego Completado! 🎉" if game_won else "💀 JAJAJA PERDISTE 💀", True, WHITE)
-WIN.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - msg.get_height()//2))
-pygame.display.flip()
-pygame.time.wait(3500)
-pygame.quit()
-sys.exit()
+        seed = random.getrandbits(32)  # semilla explícita: así la partida se puede grabar
+    recorder = ReplayRecorder(seed, FPS) if record else None
+    session = GameSession(seed=seed)
+
+    overlay = PerfOverlay(profiler, pygame.font.SysFont("monospace", 14), budget_ms=1000 / FPS)
+    governor = QualityGovernor(1000 / FPS, log_path=QUALITY_LOG_PATH, enabled=QUALITY_AUTO)
+
+    fire_requested = False
+    while not session.over:
+        frame_ms = clock.tick(fps_cap)
+        # Tiempo de trabajo del frame anterior, sin la espera del límite de FPS
+        tier = governor.observe(clock.get_rawtime())
+        if tier is not None:
+            session.apply_quality(tier)
+        profiler.begin_frame()
+        with profiler.scope("events"):
+            for event in pygame.event.get():
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                    if recorder:
+                        recorder.save(record)
+                    export_profile(); pygame.quit(); sys.exit()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    fire_requested = True  # se aplica en el siguiente tick de simulación
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    overlay.toggle()
+                    profiler.enabled = profiler.enabled or overlay.visible
+
+        # ---- Simulación a paso fijo (FPS ticks por segundo, sin importar los FPS de dibujo) ----
+        level = session.current_level
+        with profiler.scope("sim"):
+            for _ in range(timestep.advance(frame_ms)):
+                if playback is not None:
+                    bits = next(playback, None)
+                    if bits is None:  # fin de la grabación
+                        session.over = True
+                        break
+                    controls = Controls.from_bits(bits)
+                else:
+                    controls = Controls.from_keys(pygame.key.get_pressed(), fire_requested)
+                if recorder:
+                    recorder.record(controls.bits())
+                session.step(controls)
+                fire_requested = False
+                if session.over or session.current_level != level:
+                    timestep.reset()
+                    break
+
+        # ---- Dibujo (interpolado entre los dos últimos ticks) ----
+        with profiler.scope("draw"):
+            session.draw(WIN, timestep.alpha, dirty)
+        dirty.add(overlay.draw(WIN, (WIDTH - 330, 10)))
+        with profiler.scope("present"):
+            dirty.present()
+        profiler.end_frame(session.scene.counts())
+
+    if recorder:
+        recorder.save(record)
+        print(f"[REPLAY] Partida grabada en {record} ({recorder.ticks} ticks)")
+    export_profile()
+
+    WIN.fill(BLACK)
+    font_big = pygame.font.SysFont(None, 72)
+    msg = font_big.render("🎉 ¡Juego Completado! 🎉" if session.game_won else "💀 JAJAJA PERDISTE 💀", True, WHITE)
+    WIN.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - msg.get_height()//2))
+    dirty.flip()
+    pygame.time.wait(3500)
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Space Adventure")
+    parser.add_argument("--record", metavar="ARCHIVO", help="graba la entrada de la partida")
+    parser.add_argument("--replay", metavar="ARCHIVO", help="reproduce una grabación")
+    args = parser.parse_args()
+    main(record=args.record, replay=args.replay)
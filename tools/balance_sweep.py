@@ -0,0 +1,160 @@
+"""Barrido Monte Carlo de la dificultad: partidas con bot, sin ventana, en varios procesos.
+
+Para cada combinación de valores de los parámetros (constantes de main.py)
+se juegan `--runs` partidas con semillas distintas y se resume: porcentaje
+de victorias, nivel medio alcanzado, segundos medios por nivel superado y
+puntuación media. Cada partida es una tarea del ProcessPoolExecutor, así que
+el barrido escala con los núcleos disponibles.
+
+Uso (desde la raíz del proyecto):
+    python tools/balance_sweep.py --param ENEMY_SHOOT_INC=0.002,0.004,0.006 \\
+        --param BASE_ENEMIES=4,6 --runs 200 [--workers N] [--csv salida.csv]
+"""
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame # pyright: ignore[reportMissingImports]
+from core.bake import ensure_baked
+
+# Constantes de main.py que se pueden barrer (ENEMY_SPEED_* no: la velocidad de Enemy no las usa)
+TUNABLE = ("NUM_LEVELS", "BASE_ENEMIES", "PLAYER_BASE_DAMAGE",
+           "ENEMY_SHOOT_BASE", "ENEMY_SHOOT_INC", "WAVE_PAUSE_BASE_MS", "WAVE_PAUSE_PER_LEVEL_MS")
+MAX_TICKS = 60 * 60 * 30  # 30 minutos de juego por partida como mucho
+
+_game = None
+_defaults = {}
+
+
+def _init_worker():
+    """Cada proceso importa el juego y carga los assets una sola vez."""
+    global _game
+    os.chdir(ROOT)
+    import main
+    main.init_display(headless=True)
+    main.load_assets()
+    _game = main
+    _defaults.update({name: getattr(main, name) for name in TUNABLE})
+
+
+def _bake_once():
+    """Hornea el paquete de sprites antes de lanzar los workers; si no, todos lo harían a la vez."""
+    os.chdir(ROOT)
+    import main
+    if not main.USE_BAKED_ASSETS:
+        return
+    main.init_display(headless=True)
+    ensure_baked(main.BAKED_ENTRIES, main.BAKED_ASSETS_PATH).close()
+    pygame.quit()  # los workers crean su propia ventana
+
+
+def bot(session):
+    """Se coloca bajo el enemigo más cercano, dispara siempre y se aparta de las balas que caen encima."""
+    game = _game
+    p = session.player.rect
+    controls = game.Controls(fire=True)
+    danger = [b.rect.centerx for b in session.enemy_bullets
+              if p.top - 120 < b.rect.bottom < p.bottom and abs(b.rect.centerx - p.centerx) < 40]
+    if danger:
+        if sum(danger) / len(danger) >= p.centerx:
+            controls.left = True
+        else:
+            controls.right = True
+        return controls
+    targets = session.enemies.sprites() + session.boss_group.sprites()
+    if targets:
+        tx = min(targets, key=lambda e: abs(e.rect.centerx - p.centerx)).rect.centerx
+        controls.left = tx < p.centerx - 8
+        controls.right = tx > p.centerx + 8
+    return controls
+
+
+def play(task):
+    """Juega una partida con los parámetros `params` y la semilla `seed`."""
+    params, seed = task
+    game = _game
+    for name, value in _defaults.items():
+        setattr(game, name, params.get(name, value))
+    result = game.run_headless(seed=seed, max_ticks=MAX_TICKS, bot=bot)
+    return params, result
+
+
+def parse_param(text):
+    name, _, values = text.partition("=")
+    if name not in TUNABLE:
+        raise argparse.ArgumentTypeError(f"{name} no es un parámetro conocido ({', '.join(TUNABLE)})")
+    try:
+        return name, [_number(v) for v in values.split(",") if v]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valores no numéricos en {text!r}")
+
+
+def _number(text):
+    """Entero si lo es ("6"), si no float ("0.35", "1e-3")."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def summarize(results, fps):
+    n = len(results)
+    cleared = [t for r in results for t in r["level_ticks"]]
+    return {
+        "runs": n,
+        "survival": sum(r["won"] for r in results) / n,
+        "level": sum(r["level"] for r in results) / n,
+        "secs_per_level": (sum(cleared) / len(cleared) / fps) if cleared else 0.0,
+        "score": sum(r["score"] for r in results) / n,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--param", type=parse_param, action="append", default=[], metavar="NOMBRE=v1,v2")
+    parser.add_argument("--runs", type=int, default=100, help="partidas por combinación")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0, help="primera semilla")
+    parser.add_argument("--csv", help="guarda la tabla en un CSV")
+    args = parser.parse_args()
+
+    names = [name for name, _ in args.param]
+    grid = [dict(zip(names, combo)) for combo in itertools.product(*(vals for _, vals in args.param))]
+    tasks = [(params, args.seed + i) for params in grid for i in range(args.runs)]
+
+    _bake_once()
+    start = time.perf_counter()
+    by_params = {}
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        chunk = max(1, len(tasks) // (args.workers * 8))
+        for params, result in pool.map(play, tasks, chunksize=chunk):
+            by_params.setdefault(tuple(params.items()), []).append(result)
+    elapsed = time.perf_counter() - start
+
+    os.chdir(ROOT)
+    import main as game
+    rows = [dict(params) | summarize(results, game.FPS) for params, results in by_params.items()]
+    header = names + ["runs", "survival", "level", "secs_per_level", "score"]
+    print("  ".join(f"{h:>14}" for h in header))
+    for row in rows:
+        print("  ".join(f"{row[h]:>14.3f}" if isinstance(row[h], float) else f"{row[h]:>14}" for h in header))
+    print(f"\n{len(tasks)} partidas en {elapsed:.1f} s con {args.workers} procesos")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=header)
+            w.writeheader()
+            w.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()